@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TypeVar, Type, Any
 
 from .avp import Avp, AvpGrouped
-from .avp.generator import AvpGenType, generate_avps_from_defs
+from .avp.generator import AvpGenType, avp_def_index, generate_avps_from_defs
 from .packer import Packer, Unpacker
 
 
@@ -376,9 +376,8 @@ class DefinedMessage(Message):
     avp_def: AvpGenType = ()
 
     def __getattr__(self, name: str) -> Any:
-        for avp_def in self.avp_def:
-            if avp_def.attr_name == name:
-                return None
+        if name in avp_def_index(self).attr_names:
+            return None
         raise AttributeError(
             f"{self.__class__.__name__} has no attribute {name}")
 
@@ -14,6 +14,18 @@ from ..packer import ConversionError, Packer, Unpacker
 from .errors import AvpDecodeError, AvpEncodeError
 
 
+# AVP header without and with the vendor ID field
+_header = struct.Struct(">LL")
+_vendor_header = struct.Struct(">LLL")
+# fixed-width value types
+_int32 = struct.Struct("!i")
+_int64 = struct.Struct("!q")
+_uint32 = struct.Struct("!I")
+_uint64 = struct.Struct("!Q")
+_float32 = struct.Struct("!f")
+_float64 = struct.Struct("!d")
+
+
 class Avp:
     """A generic AVP type.
 
@@ -120,13 +132,19 @@ class Avp:
         Returns:
             The modified packer instance.
         """
-        flags = self.flags
-        packer.pack_uint(self.code)
-        packer.pack_uint(self.length | (flags << 24))
-        if self.vendor_id:
-            packer.pack_uint(self.vendor_id)
-        padded_payload_length = (len(self.payload) + 3) & ~3
-        packer.pack_fopaque(padded_payload_length, self.payload)
+        flags_len = self.length | (self.flags << 24)
+        vendor_id = self.vendor_id
+        payload = self.payload
+        try:
+            if vendor_id:
+                header = _vendor_header.pack(self.code, flags_len, vendor_id)
+            else:
+                header = _header.pack(self.code, flags_len)
+            # header and payload go into the buffer with a single write
+            data = header + payload
+        except (TypeError, struct.error) as e:
+            raise ConversionError(e.args[0]) from None
+        packer.pack_fopaque(len(header) + ((len(payload) + 3) & ~3), data)
         return packer
 
     @classmethod
@@ -200,23 +218,14 @@ class Avp:
         avp_payload = b""
         if avp_length > 0:
             avp_payload = unpacker.unpack_fopaque(avp_length)
-        avp_name = None
-
-        if avp_code in AVP_DICTIONARY and not avp_vendor_id:
-            avp_type: Type[Avp] = AVP_DICTIONARY[avp_code]["type"]
-            avp_name = AVP_DICTIONARY[avp_code]["name"]
 
-        elif (avp_vendor_id and avp_vendor_id in AVP_VENDOR_DICTIONARY and
-                avp_code in AVP_VENDOR_DICTIONARY[avp_vendor_id]):
-            avp_type: Type[Avp] = AVP_VENDOR_DICTIONARY[avp_vendor_id][avp_code]["type"]
-            avp_name = AVP_VENDOR_DICTIONARY[avp_vendor_id][avp_code]["name"]
-
-        else:
-            avp_type: Type[Avp] = Avp
+        entry = _dictionary_entry(avp_code, avp_vendor_id)
+        if entry is None:
+            return Avp(avp_code, avp_vendor_id, avp_payload, avp_flags)
 
+        avp_type: Type[Avp] = entry["type"]
         avp = avp_type(avp_code, avp_vendor_id, avp_payload, avp_flags)
-        if avp_name:
-            avp.name = avp_name
+        avp.name = entry["name"]
 
         return avp
 
@@ -247,14 +256,8 @@ class Avp:
             is_private: Optionally sets or unsets the private flag. Default is
                 to leave the flag untouched
         """
-        if avp_code in AVP_DICTIONARY and not vendor_id:
-            entry = AVP_DICTIONARY[avp_code]
-
-        elif (vendor_id and vendor_id in AVP_VENDOR_DICTIONARY and
-                avp_code in AVP_VENDOR_DICTIONARY[vendor_id]):
-            entry = AVP_VENDOR_DICTIONARY[vendor_id][avp_code]
-
-        else:
+        entry = _dictionary_entry(avp_code, vendor_id)
+        if entry is None:
             raise ValueError(f"AVP code {avp_code} with vendor {vendor_id} is "
                              f"unknown")
 
@@ -440,7 +443,7 @@ class AvpFloat32(Avp):
         """AVP value as a python float. When setting the value, it must be a
         32-bit integer. Larger intergers will raise an `AvpEncodeError`."""
         try:
-            return struct.unpack("!f", self.payload)[0]
+            return _float32.unpack(self.payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 32-bit "
@@ -449,7 +452,7 @@ class AvpFloat32(Avp):
     @value.setter
     def value(self, new_value: float):
         try:
-            self.payload = struct.pack("!f", new_value)
+            self.payload = _float32.pack(new_value)
         except struct.error as e:
             raise AvpEncodeError(
                 f"{self.name} value {new_value} is not a valid 32-bit "
@@ -463,7 +466,7 @@ class AvpFloat64(Avp):
         """AVP value as a python float. When setting the value, it must be a
         64-bit integer. Larger numbers will raise an `AvpEncodeError`."""
         try:
-            return struct.unpack("!d", self.payload)[0]
+            return _float64.unpack(self.payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 64-bit "
@@ -472,7 +475,7 @@ class AvpFloat64(Avp):
     @value.setter
     def value(self, new_value: float):
         try:
-            self.payload = struct.pack("!d", new_value)
+            self.payload = _float64.pack(new_value)
         except struct.error as e:
             raise AvpEncodeError(
                 f"{self.name} value {new_value} is not a valid 64-bit "
@@ -547,7 +550,7 @@ class AvpInteger32(Avp):
         the value, it must be a 32-bit integer. Larger integers will raise
         an `AvpEncodeError`."""
         try:
-            return struct.unpack("!i", self.payload)[0]
+            return _int32.unpack(self.payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 32-bit "
@@ -556,7 +559,7 @@ class AvpInteger32(Avp):
     @value.setter
     def value(self, new_value: int):
         try:
-            self.payload = struct.pack("!i", new_value)
+            self.payload = _int32.pack(new_value)
         except struct.error as e:
             raise AvpEncodeError(
                 f"{self.name} value {new_value} is not a valid 32-bit "
@@ -574,7 +577,7 @@ class AvpInteger64(Avp):
         the value, it must be a 64-bit integer. Larger integers will raise
         an `AvpEncodeError`."""
         try:
-            return struct.unpack("!q", self.payload)[0]
+            return _int64.unpack(self.payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 64-bit "
@@ -583,7 +586,7 @@ class AvpInteger64(Avp):
     @value.setter
     def value(self, new_value: int):
         try:
-            self.payload = struct.pack("!q", new_value)
+            self.payload = _int64.pack(new_value)
         except struct.error as e:
             raise AvpEncodeError(
                 f"{self.name} value {new_value} is not a valid 64-bit "
@@ -620,7 +623,7 @@ class AvpUnsigned32(Avp):
         the value, it must be a 32-bit unsigned integer. Larger and signed
         integers will raise an `AvpEncodeError`."""
         try:
-            return struct.unpack("!I", self.payload)[0]
+            return _uint32.unpack(self.payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 32-bit "
@@ -629,7 +632,7 @@ class AvpUnsigned32(Avp):
     @value.setter
     def value(self, new_value: int):
         try:
-            self.payload = struct.pack("!I", new_value)
+            self.payload = _uint32.pack(new_value)
         except struct.error as e:
             raise AvpEncodeError(
                 f"{self.name} value {new_value} is not a valid 32-bit "
@@ -647,7 +650,7 @@ class AvpUnsigned64(Avp):
         the value, it must be a 64-bit unsigned integer. Larger and signed
         integers will raise an `AvpEncodeError`."""
         try:
-            return struct.unpack("!Q", self.payload)[0]
+            return _uint64.unpack(self.payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 64-bit "
@@ -656,7 +659,7 @@ class AvpUnsigned64(Avp):
     @value.setter
     def value(self, new_value: int):
         try:
-            self.payload = struct.pack("!Q", new_value)
+            self.payload = _uint64.pack(new_value)
         except struct.error as e:
             raise AvpEncodeError(
                 f"{self.name} value {new_value} is not a valid 64-bit "
@@ -726,7 +729,7 @@ class AvpTime(Avp):
         data type, or if the datetime instance contains an unsupported value,
         will raise an `AvpEncodeError`."""
         try:
-            seconds = struct.unpack("!I", self.payload)[0]
+            seconds = _uint32.unpack(self.payload)[0]
             if seconds < self.overflow_detection_cutoff:
                 return datetime.datetime.fromtimestamp(
                     seconds + self.overflow_timestamp)
@@ -746,9 +749,9 @@ class AvpTime(Avp):
         try:
             seconds = int(new_value.timestamp())
             if seconds < self.overflow_timestamp:
-                self.payload = struct.pack("!I", seconds + self.seconds_since_1900)
+                self.payload = _uint32.pack(seconds + self.seconds_since_1900)
             else:
-                self.payload = struct.pack("!I", seconds - self.overflow_timestamp)
+                self.payload = _uint32.pack(seconds - self.overflow_timestamp)
         except struct.error as e:
             raise AvpEncodeError(
                 f"{self.name} value {new_value} cannot be encoded as a "
@@ -765,4 +768,14 @@ As enumeration is a list of valid integer values, is an alias for
 _AnyAvpType = TypeVar("_AnyAvpType", bound=Avp)
 
 
+def _dictionary_entry(avp_code: int, vendor_id: int) -> dict | None:
+    """Find the dictionary entry for an AVP code and vendor, if there is one."""
+    if not vendor_id:
+        return AVP_DICTIONARY.get(avp_code)
+    vendor_avps = AVP_VENDOR_DICTIONARY.get(vendor_id)
+    if vendor_avps is None:
+        return None
+    return vendor_avps.get(avp_code)
+
+
 from .dictionary import AVP_DICTIONARY, AVP_VENDOR_DICTIONARY
\ No newline at end of file
@@ -5,6 +5,7 @@ class attributes and from class attributes back to AVPs.
 from __future__ import annotations
 
 import logging
+import weakref
 
 from typing import NamedTuple, Protocol
 
@@ -35,6 +36,8 @@ class AvpGenDef(NamedTuple):
 # class attribute, required, avp code, vendor id, mandatory flag, typedef, is list
 AvpGenType = tuple[AvpGenDef, ...]
 
+_UNSET = object()
+
 
 def generate_avps_from_defs(obj: AvpGenerator, strict: bool = False) -> list[Avp]:
     """Go through a tree of AVP attribute definitions and produce AVPs.
@@ -43,22 +46,24 @@ def generate_avps_from_defs(obj: AvpGenerator, strict: bool = False) -> list[Avp
     and returns a complete list of AVPs, with grouped AVPs populated as well.
     """
     avp_list = []
-    if not hasattr(obj, "avp_def"):
+    avp_def = getattr(obj, "avp_def", None)
+    if avp_def is None:
         return avp_list
 
-    for gen_def in obj.avp_def:
-        if not hasattr(obj, gen_def.attr_name) and gen_def.is_required:
-            msg = f"mandatory AVP attribute `{gen_def.attr_name}` is not set"
-            if strict:
-                raise ValueError(msg)
-            else:
-                logger.debug(msg)
-            continue
-        elif not hasattr(obj, gen_def.attr_name):
+    for gen_def in avp_def:
+        # a single lookup per attribute; `_UNSET` tells apart attributes that
+        # do not exist at all from attributes that are set to None
+        attr_value = getattr(obj, gen_def.attr_name, _UNSET)
+        if attr_value is _UNSET:
+            if gen_def.is_required:
+                msg = f"mandatory AVP attribute `{gen_def.attr_name}` is not set"
+                if strict:
+                    raise ValueError(msg)
+                else:
+                    logger.debug(msg)
             continue
-        if getattr(obj, gen_def.attr_name) is None:
+        if attr_value is None:
             continue
-        attr_value = getattr(obj, gen_def.attr_name)
 
         try:
             if gen_def.type_class and isinstance(attr_value, list):
@@ -97,11 +102,46 @@ def generate_avps_from_defs(obj: AvpGenerator, strict: bool = False) -> list[Avp
                 f"Failed to parse value for attribute `{gen_def.attr_name}`: "
                 f"{e}") from None
 
-    if hasattr(obj, "additional_avps"):
-        return avp_list + getattr(obj, "additional_avps")
+    additional_avps = getattr(obj, "additional_avps", None)
+    if additional_avps:
+        return avp_list + additional_avps
     return avp_list
 
 
+class AvpDefIndex(NamedTuple):
+    """Lookups derived from the `avp_def` of an AVP generator class."""
+    avp_def: AvpGenType
+    """The AVP definitions that the lookups were built from."""
+    attr_names: frozenset[str]
+    """Names of all attributes that have an AVP definition."""
+    by_code: dict[tuple[int, int], AvpGenDef]
+    """AVP definitions keyed by AVP code and vendor ID."""
+
+
+_avp_def_index_cache: weakref.WeakKeyDictionary[type, AvpDefIndex] = (
+    weakref.WeakKeyDictionary())
+
+
+def avp_def_index(obj: AvpGenerator) -> AvpDefIndex:
+    """Retrieve lookups for the AVP definitions of an object.
+
+    The lookups depend only on the `avp_def` of the object's class, so they
+    are built once per class and cached, instead of once for every message and
+    grouped AVP that is encoded or decoded. The cache entry is rebuilt if the
+    class `avp_def` is replaced, and is dropped when the class itself is
+    garbage collected.
+    """
+    avp_def = obj.avp_def
+    index = _avp_def_index_cache.get(obj.__class__)
+    if index is None or index.avp_def is not avp_def:
+        index = AvpDefIndex(
+            avp_def,
+            frozenset(a.attr_name for a in avp_def),
+            {(a.avp_code, a.vendor_id): a for a in avp_def})
+        _avp_def_index_cache[obj.__class__] = index
+    return index
+
+
 class AvpGenerator(Protocol):
     """A generic type structure that describes a single AVP generator.
 
@@ -2,23 +2,24 @@
 Python classes that represent individual grouped AVPs.
 
 Each grouped AVP is represented by a python dataclass. Each dataclass contains
-one special attribute named `avp_def`, which is always a tuple of `AvpGenType`
-instances, which dictate to which AVP each dataclass attribute maps to.
+one special class variable named `avp_def`, which is always a tuple of
+`AvpGenDef` instances, which dictate to which AVP each dataclass attribute maps
+to. The `avp_def` is shared by all instances of the class and is not part of
+the dataclass fields.
 """
 from __future__ import annotations
 
 import dataclasses
 import datetime
-import logging
+
+from typing import ClassVar
 
 from ..avp import Avp
 from ..avp.generator import AvpGenDef, AvpGenType
 from ..constants import *
 
-logger = logging.getLogger("diameter.avp")
-
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class GenericSpec:
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
@@ -28,7 +29,7 @@ class GenericSpec:
 # specific order that variables must be declared in.
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class FailedAvp:
     """A data container that represents the "Failed-AVP" (279) grouped AVP.
 
@@ -36,39 +37,36 @@ class FailedAvp:
     AVPs should be copied into the `additional_avps` attribute.
     """
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = ()
+    avp_def: ClassVar[AvpGenType] = ()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class VendorSpecificApplicationId:
     """A data container that represents the "Vendor-Specific-Application-ID" (260) grouped AVP."""
     vendor_id: int = None
     auth_application_id: int = None
     acct_application_id: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("vendor_id", AVP_VENDOR_ID, is_required=True),
         AvpGenDef("auth_application_id", AVP_AUTH_APPLICATION_ID),
         AvpGenDef("acct_application_id", AVP_ACCT_APPLICATION_ID),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ExperimentalResult:
     """A data container that represents the "Experimental-Result" (297) grouped AVP."""
     vendor_id: int = None
     experimental_result_code: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("vendor_id", AVP_VENDOR_ID, is_required=True),
         AvpGenDef("experimental_result_code", AVP_ETSI_ETSI_EXPERIMENTAL_RESULT_CODE, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipMnAaaAuth:
     """A data container that represents the "MIP-MN-AAA-Auth" (322) grouped AVP."""
     mip_mn_aaa_spi: int = None
@@ -77,8 +75,7 @@ class MipMnAaaAuth:
     mip_authenticator_offset: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mip_mn_aaa_spi", AVP_MIP_MN_AAA_SPI, is_required=True),
         AvpGenDef("mip_auth_input_data_length", AVP_MIP_AUTH_INPUT_DATA_LENGTH, is_required=True),
         AvpGenDef("mip_authenticator_length", AVP_MIP_AUTHENTICATOR_LENGTH, is_required=True),
@@ -86,7 +83,7 @@ class MipMnAaaAuth:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipMnToFaMsa:
     """A data container that represents the "MIP-MN-to-FA-MSA" (325) grouped AVP.
 
@@ -100,15 +97,14 @@ class MipMnToFaMsa:
     mip_nonce: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mip_mn_to_fa_spi", AVP_MIP_MN_TO_FA_SPI, is_required=True),
         AvpGenDef("mip_algorithm_type", AVP_MIP_ALGORITHM_TYPE, is_required=True),
         AvpGenDef("mip_nonce", AVP_MIP_NONCE, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipFaToMnMsa:
     """A data container that represents the "MIP-FA-to-MN-MSA" (326) grouped AVP."""
     mip_fa_to_mn_spi: int = None
@@ -116,15 +112,14 @@ class MipFaToMnMsa:
     mip_session_key: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mip_fa_to_mn_spi", AVP_MIP_FA_TO_MN_SPI, is_required=True),
         AvpGenDef("mip_algorithm_type", AVP_MIP_ALGORITHM_TYPE, is_required=True),
         AvpGenDef("mip_session_key", AVP_MIP_SESSION_KEY, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipFaToHaMsa:
     """A data container that represents the "MIP-FA-to-HA-MSA" (328) grouped AVP."""
     mip_fa_to_ha_spi: int = None
@@ -132,15 +127,14 @@ class MipFaToHaMsa:
     mip_session_key: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mip_fa_to_ha_spi", AVP_MIP_FA_TO_HA_SPI, is_required=True),
         AvpGenDef("mip_algorithm_type", AVP_MIP_ALGORITHM_TYPE, is_required=True),
         AvpGenDef("mip_session_key", AVP_MIP_SESSION_KEY, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipHaToFaMsa:
     """A data container that represents the "MIP-HA-to-FA-MSA" (329) grouped AVP."""
     mip_ha_to_fa_spi: int = None
@@ -148,15 +142,14 @@ class MipHaToFaMsa:
     mip_session_key: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mip_ha_to_fa_spi", AVP_MIP_HA_TO_FA_SPI, is_required=True),
         AvpGenDef("mip_algorithm_type", AVP_MIP_ALGORITHM_TYPE, is_required=True),
         AvpGenDef("mip_session_key", AVP_MIP_SESSION_KEY, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipMnToHaMsa:
     """A data container that represents the "MIP-MN-to-HA-MSA" (331) grouped AVP."""
     mip_mn_ha_spi: int = None
@@ -165,8 +158,7 @@ class MipMnToHaMsa:
     mip_nonce: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mip_mn_ha_spi", AVP_MIP_MN_HA_SPI, is_required=True),
         AvpGenDef("mip_algorithm_type", AVP_MIP_ALGORITHM_TYPE, is_required=True),
         AvpGenDef("mip_replay_mode", AVP_MIP_REPLAY_MODE, is_required=True),
@@ -174,7 +166,7 @@ class MipMnToHaMsa:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipHaToMnMsa:
     """A data container that represents the "MIP-HA-to-MN-MSA" (332) grouped AVP.
 
@@ -190,8 +182,7 @@ class MipHaToMnMsa:
     mip_session_key: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mip_ha_to_mn_spi", AVP_MIP_HA_TO_FA_SPI, is_required=True),
         AvpGenDef("mip_algorithm_type", AVP_MIP_ALGORITHM_TYPE, is_required=True),
         AvpGenDef("mip_replay_mode", AVP_MIP_REPLAY_MODE, is_required=True),
@@ -199,61 +190,57 @@ class MipHaToMnMsa:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipOriginatingForeignAaa:
     """A data container that represents the "MIP-Originating-Foreign-AAA" (347) grouped AVP."""
     origin_realm: bytes = None
     origin_host: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("origin_realm", AVP_ORIGIN_REALM, is_required=True),
         AvpGenDef("origin_host", AVP_ORIGIN_HOST, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MipHomeAgentHost:
     """A data container that represents the "MIP-Home-Agent-Host" (348) grouped AVP."""
     origin_realm: bytes = None
     origin_host: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("origin_realm", AVP_ORIGIN_REALM, is_required=True),
         AvpGenDef("origin_host", AVP_ORIGIN_HOST, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class UnitValue:
     """A data container that represents the "Unit-Value" grouped AVP."""
     value_digits: int = None
     exponent: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("value_digits", AVP_VALUE_DIGITS, is_required=True),
         AvpGenDef("exponent", AVP_EXPONENT)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class CcMoney:
     """A data container that represents the "CC-Money" grouped AVP."""
     unit_value: UnitValue = None
     currency_code: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("unit_value", AVP_UNIT_VALUE, is_required=True, type_class=UnitValue),
         AvpGenDef("currency_code", AVP_CURRENCY_CODE)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class GrantedServiceUnit:
     """A data container that represents the "Granted-Service-Unit" grouped AVP."""
     cc_time: int = None
@@ -262,8 +249,7 @@ class GrantedServiceUnit:
     cc_input_octets: int = None
     cc_service_specific_units: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("cc_time", AVP_CC_TIME),
         AvpGenDef("cc_money", AVP_CC_MONEY, type_class=CcMoney),
         AvpGenDef("cc_total_octets", AVP_CC_TOTAL_OCTETS),
@@ -280,7 +266,7 @@ identical.
 """
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class UsedServiceUnit:
     """A data container that represents the "Used-Service-Unit" (402) grouped AVP."""
     tariff_change_usage: int = None
@@ -295,8 +281,7 @@ class UsedServiceUnit:
     reporting_reason: int = None
     event_charging_timestamp: list[datetime.datetime] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("tariff_change_usage", AVP_TARIFF_CHANGE_USAGE),
         AvpGenDef("cc_time", AVP_CC_TIME),
         AvpGenDef("cc_money", AVP_CC_MONEY, type_class=CcMoney),
@@ -310,35 +295,33 @@ class UsedServiceUnit:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class GsuPoolReference:
     """A data container that represents the "G-S-U-Pool-Reference" grouped AVP."""
     g_s_u_pool_identifier: int = None
     cc_unit_type: int = None
     unit_value: UnitValue = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("g_s_u_pool_identifier", AVP_G_S_U_POOL_IDENTIFIER, is_required=True),
         AvpGenDef("cc_unit_type", AVP_CC_UNIT_TYPE, is_required=True),
         AvpGenDef("unit_value", AVP_UNIT_VALUE, is_required=True, type_class=UnitValue)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RedirectServer:
     """A data container that represents the "Redirect-Server" grouped AVP."""
     redirect_address_type: int = None
     redirect_server_address: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("redirect_address_type", AVP_REDIRECT_ADDRESS_TYPE, is_required=True),
         AvpGenDef("redirect_server_address", AVP_REDIRECT_SERVER_ADDRESS, is_required=True)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TimeOfDayCondition:
     """A data container that represents the "Time-Of-Day-Condition" grouped AVP."""
     time_of_day_start: int = None
@@ -351,8 +334,7 @@ class TimeOfDayCondition:
     timezone_flag: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("time_of_day_start", AVP_TIME_OF_DAY_START),
         AvpGenDef("time_of_day_end", AVP_TIME_OF_DAY_END),
         AvpGenDef("day_of_week_mask", AVP_DAY_OF_WEEK_MASK),
@@ -364,7 +346,7 @@ class TimeOfDayCondition:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class FinalUnitIndication:
     """A data container that represents the "Final-Unit-Indication" grouped AVP.
 
@@ -379,8 +361,7 @@ class FinalUnitIndication:
     # rfc8560 doesn't say this is permitted, but realworld samples say otherwise
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("final_unit_action", AVP_FINAL_UNIT_ACTION, is_required=True),
         AvpGenDef("restriction_filter_rule", AVP_RESTRICTION_FILTER_RULE),
         AvpGenDef("filter_id", AVP_FILTER_ID),
@@ -388,77 +369,72 @@ class FinalUnitIndication:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class IpAddressRange:
     """A data container that represents the "IP-Address-Range" grouped AVP."""
     ip_address_start: str = None
     ip_address_end: str = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("ip_address_start", AVP_IP_ADDRESS_START),
         AvpGenDef("ip_address_end", AVP_IP_ADDRESS_END)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class IpAddressMask:
     """A data container that represents the "IP-Address-Mask" grouped AVP."""
     ip_address: str = None
     ip_bit_mask_width: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("ip_address", AVP_IP_ADDRESS),
         AvpGenDef("ip_bit_mask_width", AVP_IP_BIT_MASK_WIDTH)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MacAddressMask:
     """A data container that represents the "MAC-Address-Mask" grouped AVP."""
     mac_address: bytes = None
     mac_address_mask_pattern: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mac_address", AVP_MAC_ADDRESS, is_required=True),
         AvpGenDef("mac_address_mask_pattern", AVP_MAC_ADDRESS_MASK_PATTERN, is_required=True)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class Eui64AddressMask:
     """A data container that represents the "EUI64-Address-Mask" grouped AVP."""
     eui64_address: bytes = None
     eui64_address_mask_pattern: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("eui64_address", AVP_EUI64_ADDRESS, is_required=True),
         AvpGenDef("eui64_address_mask_pattern", AVP_EUI64_ADDRESS_MASK_PATTERN, is_required=True)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class PortRange:
     """A data container that represents the "Port-Range" grouped AVP."""
     port_start: int = None
     port_end: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("port_start", AVP_PORT_START),
         AvpGenDef("port_end", AVP_PORT_END)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class FromToSpec:
     ip_address: list[str] = dataclasses.field(default_factory=list)
     ip_address_range: list[IpAddressRange] = dataclasses.field(default_factory=list)
@@ -473,8 +449,7 @@ class FromToSpec:
     use_assigned_address: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("ip_address", AVP_IP_ADDRESS),
         AvpGenDef("ip_address_range", AVP_IP_ADDRESS_RANGE, type_class=IpAddressRange),
         AvpGenDef("ip_address_mask", AVP_IP_ADDRESS_MASK, type_class=IpAddressMask),
@@ -489,19 +464,19 @@ class FromToSpec:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class FromSpec(FromToSpec):
     """A data container that represents the From-Spec AVP."""
     pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ToSpec(FromToSpec):
     """A data container that represents the To-Spec AVP."""
     pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class IpOption:
     """A data container that represents the IP-Option AVP."""
     ip_option_type: int = None
@@ -509,15 +484,14 @@ class IpOption:
     negated: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("ip_option_type", AVP_IP_OPTION_TYPE, is_required=True),
         AvpGenDef("ip_option_value", AVP_IP_OPTION_VALUE),
         AvpGenDef("negated", AVP_NEGATED)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TcpOption(GenericSpec):
     """A data container that represents the Tcp-Option AVP."""
     tcp_option_type: int = None
@@ -525,29 +499,27 @@ class TcpOption(GenericSpec):
     negated: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("tcp_option_type", AVP_TCP_OPTION_TYPE, is_required=True),
         AvpGenDef("tcp_option_value", AVP_TCP_OPTION_VALUE),
         AvpGenDef("negated", AVP_NEGATED)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TcpFlags:
     """A data container that represents the Tcp-Flags AVP."""
     tcp_flag_type: int = None
     negated: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("tcp_flag_type", AVP_TCP_FLAG_TYPE, is_required=True),
         AvpGenDef("negated", AVP_NEGATED)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class IcmpType:
     """A data container that represents the ICMP-Type AVP."""
     icmp_type_number: int = None
@@ -555,43 +527,40 @@ class IcmpType:
     negated: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("icmp_type_number", AVP_ICMP_TYPE_NUMBER, is_required=True),
         AvpGenDef("icmp_code", AVP_ICMP_CODE),
         AvpGenDef("negated", AVP_NEGATED)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class EthProtoType:
     """A data container that represents the ETH-Proto-Type AVP."""
     eth_ether_type: list[bytes] = dataclasses.field(default_factory=list)
     eth_sap: list[bytes] = dataclasses.field(default_factory=list)
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("eth_ether_type", AVP_ETH_ETHER_TYPE),
         AvpGenDef("eth_sap", AVP_ETH_SAP)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class UserPriorityRange:
     """A data container that represents the User-Priority-Range AVP."""
     low_user_priority: list[int] = dataclasses.field(default_factory=list)
     high_user_priority: list[int] = dataclasses.field(default_factory=list)
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("low_user_priority", AVP_LOW_USER_PRIORITY),
         AvpGenDef("high_user_priority", AVP_HIGH_USER_PRIORITY)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class VlanIdRange:
     """A data container that represents the VLAN-ID-Range AVP."""
     s_vid_start: int = None
@@ -600,8 +569,7 @@ class VlanIdRange:
     c_vid_end: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("s_vid_start", AVP_S_VID_START),
         AvpGenDef("s_vid_end", AVP_S_VID_END),
         AvpGenDef("c_vid_start", AVP_C_VID_START),
@@ -609,7 +577,7 @@ class VlanIdRange:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class EthOption:
     """A data container that represents the ETH-Option AVP."""
     eth_proto_type: EthProtoType = None
@@ -617,18 +585,17 @@ class EthOption:
     user_priority_range: list[int] = dataclasses.field(default_factory=list)
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("eth_proto_type", AVP_ETH_PROTO_TYPE, is_required=True, type_class=EthProtoType),
         AvpGenDef("vlan_id_range", AVP_VLAN_ID_RANGE, type_class=VlanIdRange),
         AvpGenDef("user_priority_range", AVP_USER_PRIORITY_RANGE, type_class=UserPriorityRange)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class Classifier:
     """A data container that represents the "Clasifier" grouped AVP."""
-    classifier_id: int = None
+    classifier_id: bytes = None
     protocol: int = None
     direction: int = None
     from_spec: list[FromSpec] = dataclasses.field(default_factory=list)
@@ -642,9 +609,8 @@ class Classifier:
     eth_option: list[EthOption] = dataclasses.field(default_factory=list)
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
-        AvpGenDef("vendor_id", AVP_VENDOR_ID, is_required=True),
+    avp_def: ClassVar[AvpGenType] = (
+        AvpGenDef("classifier_id", AVP_CLASSIFIER_ID, is_required=True),
         AvpGenDef("protocol", AVP_PROTOCOL),
         AvpGenDef("direction", AVP_DIRECTION),
         AvpGenDef("from_spec", AVP_FROM_SPEC, type_class=FromSpec),
@@ -659,29 +625,27 @@ class Classifier:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class QosParameters:
     """A data container that represents the "QoS-Parameters" grouped AVP."""
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = ()
+    avp_def: ClassVar[AvpGenType] = ()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class QosProfileTemplate:
     """A data container that represents the "QoS-Profile-Template" grouped AVP."""
     vendor_id: int = None
     qos_profile_id: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("vendor_id", AVP_VENDOR_ID, is_required=True),
         AvpGenDef("qos_profile_id", AVP_QOS_PROFILE_ID, is_required=True)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ExcessTreatment:
     """A data container that represents the "Excess-Treatment" grouped AVP."""
     treatment_action: int = None
@@ -689,15 +653,14 @@ class ExcessTreatment:
     qos_parameters: QosParameters = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("treatment_action", AVP_TREATMENT_ACTION, is_required=True),
         AvpGenDef("qos_profile_template", AVP_QOS_PROFILE_TEMPLATE, type_class=QosProfileTemplate),
         AvpGenDef("qos_parameters", AVP_QOS_PARAMETERS, type_class=QosParameters),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class FilterRule:
     """A data container that represents the "Filter-Rule" grouped AVP.
 
@@ -713,8 +676,7 @@ class FilterRule:
     qos_parameters: QosParameters = None
     excess_treatment: ExcessTreatment = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("filter_rule_precedence", AVP_FILTER_RULE_PRECEDENCE),
         AvpGenDef("classifier", AVP_CLASSIFIER, type_class=Classifier),
         AvpGenDef("time_of_day_condition", AVP_TIME_OF_DAY_CONDITION, type_class=TimeOfDayCondition),
@@ -726,46 +688,43 @@ class FilterRule:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ServiceParameterInfo:
     """A data container that represents the "Service-Parameter-Info" grouped AVP."""
     service_parameter_type: int = None
     service_parameter_value: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("service_parameter_type", AVP_SERVICE_PARAMETER_TYPE, is_required=True),
         AvpGenDef("service_parameter_value", AVP_SERVICE_PARAMETER_VALUE, is_required=True)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class SubscriptionId:
     """A data container that represents the "Subscription-ID" grouped AVP."""
     subscription_id_type: int = None
     subscription_id_data: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("subscription_id_type", AVP_SUBSCRIPTION_ID_TYPE, is_required=True),
         AvpGenDef("subscription_id_data", AVP_SUBSCRIPTION_ID_DATA, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class UserEquipmentInfo:
     """A data container that represents the "User-Equipment-Info" grouped AVP."""
     user_equipment_info_type: int = None
     user_equipment_info_value: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("user_equipment_info_type", AVP_USER_EQUIPMENT_INFO_TYPE, is_required=True),
         AvpGenDef("user_equipment_info_value", AVP_USER_EQUIPMENT_INFO_VALUE, is_required=True)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class UserEquipmentInfoExtension:
     """A data container that represents the "User-Equipment-Info-Extension" grouped AVP."""
     user_equipment_info_imeisv: bytes = None
@@ -774,8 +733,7 @@ class UserEquipmentInfoExtension:
     user_equipment_info_modifiedeui64: bytes = None
     user_equipment_info_imei: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("user_equipment_info_imeisv", AVP_USER_EQUIPMENT_INFO_IMEISV),
         AvpGenDef("user_equipment_info_mac", AVP_USER_EQUIPMENT_INFO_MAC),
         AvpGenDef("user_equipment_info_eui64", AVP_USER_EQUIPMENT_INFO_EUI64),
@@ -784,35 +742,33 @@ class UserEquipmentInfoExtension:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ProxyInfo:
     """A data container that represents the "Proxy-Info" grouped AVP."""
     proxy_host: bytes = None
     proxy_state: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("proxy_host", AVP_PROXY_HOST, is_required=True),
         AvpGenDef("proxy_state", AVP_PROXY_STATE, is_required=True)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class CostInformation:
     """A data container that represents the "Cost-Information" grouped AVP."""
     unit_value: UnitValue = None
     currency_code: int = None
     cost_unit: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("unit_value", AVP_UNIT_VALUE, is_required=True, type_class=UnitValue),
         AvpGenDef("currency_code", AVP_CURRENCY_CODE, is_required=True),
         AvpGenDef("cost_unit", AVP_COST_UNIT)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RedirectServerExtension:
     """A data container that represents the "Redirect-Server-Extension" grouped AVP.
 
@@ -827,15 +783,14 @@ class RedirectServerExtension:
     redirect_address_sip_url: str = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("redirect_address_ipaddress", AVP_REDIRECT_ADDRESS_IPADDRESS),
         AvpGenDef("redirect_address_url", AVP_REDIRECT_ADDRESS_URL),
         AvpGenDef("redirect_address_sip_url", AVP_REDIRECT_ADDRESS_SIP_URI)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class QosFinalUnitIndication:
     """A data container that represents the "QoS-Final-Unit-Indication" (669) grouped AVP."""
     final_unit_action: int = None
@@ -844,8 +799,7 @@ class QosFinalUnitIndication:
     redirect_server_extension: RedirectServerExtension = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("final_unit_action", AVP_FINAL_UNIT_ACTION, is_required=True),
         AvpGenDef("filter_rule", AVP_FILTER_RULE, type_class=FilterRule),
         AvpGenDef("redirect_server_extension", AVP_REDIRECT_SERVER_EXTENSION, type_class=RedirectServerExtension),
@@ -853,7 +807,7 @@ class QosFinalUnitIndication:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class Tunneling:
     """A data container that represents the "Tunneling" (401) grouped AVP."""
     tunnel_type: int = None
@@ -867,8 +821,7 @@ class Tunneling:
     tunnel_password: bytes = None
     tunnel_private_group_id: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("tunnel_type", AVP_TUNNEL_TYPE, is_required=True),
         AvpGenDef("tunnel_medium_type", AVP_TUNNEL_MEDIUM_TYPE, is_required=True),
         AvpGenDef("tunnel_client_endpoint", AVP_TUNNEL_CLIENT_ENDPOINT, is_required=True),
@@ -882,7 +835,7 @@ class Tunneling:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ChapAuth:
     """A data container that represents the "Chap-Auth" (402) grouped AVP."""
     chap_algorithm: int = None
@@ -890,15 +843,14 @@ class ChapAuth:
     chap_response: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("chap_algorithm", AVP_CHAP_ALGORITHM, is_required=True),
         AvpGenDef("chap_ident", AVP_CHAP_IDENT, is_required=True),
         AvpGenDef("chap_response", AVP_CHAP_RESPONSE)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class OcSupportedFeatures:
     """A data container that represents the "OC-Supported-Features" (621) grouped AVP.
 
@@ -907,13 +859,12 @@ class OcSupportedFeatures:
     oc_feature_vector: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
-        AvpGenDef("vendor_id", AVP_OC_FEATURE_VECTOR),
+    avp_def: ClassVar[AvpGenType] = (
+        AvpGenDef("oc_feature_vector", AVP_OC_FEATURE_VECTOR),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class OcOlr:
     """A data container that represents the "OC-OLR" (623) grouped AVP.
 
@@ -925,8 +876,7 @@ class OcOlr:
     oc_validity_duration: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("oc_sequence_number", AVP_OC_SEQUENCE_NUMBER, is_required=True),
         AvpGenDef("oc_report_type", AVP_OC_REPORT_TYPE, is_required=True),
         AvpGenDef("oc_reduction_percentage", AVP_OC_REDUCTION_PERCENTAGE),
@@ -934,7 +884,7 @@ class OcOlr:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class Flows:
     """A data container that represents the "Flows" (510) grouped AVP.
 
@@ -947,8 +897,7 @@ class Flows:
     media_component_status: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("media_component_number", AVP_TGPP_MEDIA_COMPONENT_NUMBER, VENDOR_TGPP, is_required=True),
         AvpGenDef("flow_number", AVP_TGPP_FLOW_NUMBER, VENDOR_TGPP),
         AvpGenDef("content_version", AVP_TGPP_CONTENT_VERSION, VENDOR_TGPP),
@@ -957,7 +906,7 @@ class Flows:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class CalleeInformation:
     """A data container that represents the "Callee-Information" (565) grouped AVP.
 
@@ -968,15 +917,14 @@ class CalleeInformation:
     called_asserted_identity: list[str] = dataclasses.field(default_factory=list)
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("called_party_address", AVP_TGPP_CALLED_PARTY_ADDRESS, VENDOR_TGPP),
         AvpGenDef("requested_party_address", AVP_TGPP_REQUESTED_PARTY_ADDRESS, VENDOR_TGPP),
         AvpGenDef("called_asserted_identity", AVP_TGPP_CALLED_ASSERTED_IDENTITY, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ServerCapabilities:
     """A data container that represents the "Server-Capabilities" (603) grouped AVP.
 
@@ -987,15 +935,14 @@ class ServerCapabilities:
     server_name: list[str] = dataclasses.field(default_factory=list)
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mandatory_capability", AVP_TGPP_MANDATORY_CAPABILITY, VENDOR_TGPP),
         AvpGenDef("optional_capability", AVP_TGPP_OPTIONAL_CAPABILITY, VENDOR_TGPP),
         AvpGenDef("server_name", AVP_TGPP_SERVER_NAME, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class SupportedFeatures:
     """A data container that represents the "Supported-Features" (628) grouped AVP.
 
@@ -1006,15 +953,14 @@ class SupportedFeatures:
     feature_list: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("vendor_id", AVP_VENDOR_ID, is_required=True),
         AvpGenDef("feature_list_id", AVP_TGPP_FEATURE_LIST_ID, VENDOR_TGPP, is_required=True),
         AvpGenDef("feature_list", AVP_TGPP_FEATURE_LIST, VENDOR_TGPP, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class EventType:
     """A data container that represents the "Event-Type" (823) grouped AVP.
 
@@ -1024,15 +970,14 @@ class EventType:
     event: str = None
     expires: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("sip_method", AVP_SIP_METHOD),
         AvpGenDef("event", AVP_TGPP_EVENT, VENDOR_TGPP),
         AvpGenDef("expires", AVP_TGPP_EXPIRES, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TimeStamps:
     """A data container that represents the "Time-Stamps" (833) grouped AVP.
 
@@ -1043,8 +988,7 @@ class TimeStamps:
     sip_request_timestamp_fraction: int = None
     sip_response_timestamp_fraction: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("sip_request_timestamp", AVP_TGPP_SIP_REQUEST_TIMESTAMP, VENDOR_TGPP),
         AvpGenDef("sip_response_timestamp", AVP_TGPP_SIP_RESPONSE_TIMESTAMP, VENDOR_TGPP),
         AvpGenDef("sip_request_timestamp_fraction", AVP_TGPP_SIP_REQUEST_TIMESTAMP_FRACTION, VENDOR_TGPP),
@@ -1052,7 +996,7 @@ class TimeStamps:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class InterOperatorIdentifier:
     """A data container that represents the "Inter-Operator-Identifier" (838) grouped AVP.
 
@@ -1061,14 +1005,13 @@ class InterOperatorIdentifier:
     originating_ioi: str = None
     terminating_ioi: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("originating_ioi", AVP_TGPP_ORIGINATING_IOI, VENDOR_TGPP),
         AvpGenDef("terminating_ioi", AVP_TGPP_TERMINATING_IOI, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class SdpMediaComponent:
     """A data container that represents the "SDP-Media-Component" (843) grouped AVP.
 
@@ -1085,8 +1028,7 @@ class SdpMediaComponent:
     access_network_charging_identifier_value: bytes = None
     sdp_type: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("sdp_media_name", AVP_TGPP_SDP_MEDIA_NAME, VENDOR_TGPP),
         AvpGenDef("sdp_media_description", AVP_TGPP_SDP_MEDIA_DESCRIPTION, VENDOR_TGPP),
         AvpGenDef("local_gw_inserted_indication", AVP_TGPP_LOCAL_GW_INSERTED_INDICATOR, VENDOR_TGPP),
@@ -1100,7 +1042,7 @@ class SdpMediaComponent:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ApplicationServerInformation:
     """A data container that represents the "Application-Server-Information" (850) grouped AVP.
 
@@ -1110,15 +1052,14 @@ class ApplicationServerInformation:
     application_provided_called_party_address: list[str] = dataclasses.field(default_factory=list)
     status_as_code: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("application_server", AVP_TGPP_APPLICATION_SERVER, VENDOR_TGPP),
         AvpGenDef("application_provided_called_party_address", AVP_TGPP_APPLICATION_PROVIDED_CALLED_PARTY_ADDRESS, VENDOR_TGPP),
         AvpGenDef("status_as_code", AVP_TGPP_STATUS_AS_CODE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TrunkGroupId:
     """A data container that represents the "Application-Server-Information" (850) grouped AVP.
 
@@ -1127,14 +1068,13 @@ class TrunkGroupId:
     incoming_trunk_group_id: str = None
     outgoing_trunk_group_id: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("incoming_trunk_group_id", AVP_TGPP_INCOMING_TRUNK_GROUP_ID, VENDOR_TGPP),
         AvpGenDef("outgoing_trunk_group_id", AVP_TGPP_OUTGOING_TRUNK_GROUP_ID, VENDOR_TGPP)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class Cause:
     """A data container that represents the "Cause" (860) grouped AVP.
 
@@ -1143,15 +1083,14 @@ class Cause:
     cause_code: int = None
     node_functionality: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("cause_code", AVP_TGPP_CAUSE_CODE, VENDOR_TGPP, is_required=True),
         AvpGenDef("node_functionality", AVP_TGPP_NODE_FUNCTIONALITY, VENDOR_TGPP, is_required=True),
     )
 
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class PsFurnishChargingInformation:
     """A data container that represents the "PS-Furnish-Charging-Information" (865) grouped AVP.
 
@@ -1161,15 +1100,14 @@ class PsFurnishChargingInformation:
     ps_free_format_data: bytes = None
     ps_append_free_format_data: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("tgpp_charging_id", AVP_TGPP_3GPP_CHARGING_ID, VENDOR_TGPP, is_required=True),
         AvpGenDef("ps_free_format_data", AVP_TGPP_PS_FREE_FORMAT_DATA, VENDOR_TGPP, is_required=True),
         AvpGenDef("ps_append_free_format_data", AVP_TGPP_PS_APPEND_FREE_FORMAT_DATA, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class LcsClientName:
     """A data container that represents the "LCS-Client-Name" (1235) grouped AVP.
 
@@ -1179,15 +1117,14 @@ class LcsClientName:
     lcs_name_string: str = None
     lcs_format_indicator: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("lcs_data_coding_scheme", AVP_TGPP_LCS_DATA_CODING_SCHEME, VENDOR_TGPP),
         AvpGenDef("lcs_name_string", AVP_TGPP_LCS_NAME_STRING, VENDOR_TGPP),
         AvpGenDef("lcs_format_indicator", AVP_TGPP_LCS_FORMAT_INDICATOR, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class LcsRequestorId:
     """A data container that represents the "LCS-Requestor-ID" (1239) grouped AVP.
 
@@ -1196,14 +1133,13 @@ class LcsRequestorId:
     lcs_data_coding_scheme: str = None
     lcs_requestor_id_string: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("lcs_data_coding_scheme", AVP_TGPP_LCS_DATA_CODING_SCHEME, VENDOR_TGPP),
         AvpGenDef("lcs_requestor_id_string", AVP_TGPP_LCS_REQUESTOR_ID_STRING, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class LcsClientId:
     """A data container that represents the "LCS-Client-ID" (1232) grouped AVP.
 
@@ -1216,8 +1152,7 @@ class LcsClientId:
     lcs_apn: str = None
     lcs_requestor_id: LcsRequestorId = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("lcs_client_type", AVP_TGPP_LCS_CLIENT_TYPE, VENDOR_TGPP),
         AvpGenDef("lcs_client_external_id", AVP_TGPP_LCS_CLIENT_EXTERNAL_ID, VENDOR_TGPP),
         AvpGenDef("lcs_client_dialed_by_ms", AVP_TGPP_LCS_CLIENT_DIALED_BY_MS, VENDOR_TGPP),
@@ -1227,7 +1162,7 @@ class LcsClientId:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class LocationType:
     """A data container that represents the "Location-Type" (1244) grouped AVP.
 
@@ -1236,14 +1171,13 @@ class LocationType:
     location_estimate_type: int = None
     deferred_location_event_type: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("location_estimate_type", AVP_TGPP_LOCATION_ESTIMATE_TYPE, VENDOR_TGPP),
         AvpGenDef("deferred_location_event_type", AVP_TGPP_DEFERRED_LOCATION_EVENT_TYPE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class LcsInformation:
     """A data container that represents the "LCS-Information" (878) grouped AVP.
 
@@ -1256,8 +1190,7 @@ class LcsInformation:
     tgpp_imsi: str = None
     msisdn: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("lcs_client_id", AVP_TGPP_LCS_CLIENT_ID, VENDOR_TGPP, type_class=LcsClientId),
         AvpGenDef("location_type", AVP_TGPP_LOCATION_TYPE, VENDOR_TGPP, type_class=LocationType),
         AvpGenDef("location_estimate", AVP_TGPP_LOCATION_ESTIMATE, VENDOR_TGPP),
@@ -1267,7 +1200,7 @@ class LcsInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MessageBody:
     """A data container that represents the "Message-Body" (889) grouped AVP.
 
@@ -1278,8 +1211,7 @@ class MessageBody:
     content_disposition: str = None
     originator: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("content_type", AVP_TGPP_CONTENT_TYPE, VENDOR_TGPP, is_required=True),
         AvpGenDef("content_length", AVP_TGPP_CONTENT_LENGTH, VENDOR_TGPP, is_required=True),
         AvpGenDef("content_disposition", AVP_TGPP_CONTENT_DISPOSITION, VENDOR_TGPP),
@@ -1287,7 +1219,7 @@ class MessageBody:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AddressDomain:
     """A data container that represents the "Address-Domain" (898) grouped AVP.
 
@@ -1296,14 +1228,13 @@ class AddressDomain:
     domain_name: str = None
     tgpp_imsi_mcc_mnc: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("domain_name", AVP_TGPP_DOMAIN_NAME, VENDOR_TGPP),
         AvpGenDef("tgpp_imsi_mcc_mnc", AVP_TGPP_3GPP_IMSI_MCC_MNC, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class OriginatorAddress:
     """A data container that represents the "Originator-Address" (886) grouped AVP.
 
@@ -1313,15 +1244,14 @@ class OriginatorAddress:
     address_data: str = None
     address_domain: AddressDomain = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("address_type", AVP_TGPP_ADDRESS_TYPE, VENDOR_TGPP),
         AvpGenDef("address_data", AVP_TGPP_ADDRESS_DATA, VENDOR_TGPP),
         AvpGenDef("address_domain", AVP_TGPP_ADDRESS_DOMAIN, VENDOR_TGPP, type_class=AddressDomain),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class QosInformation:
     """A data container that represents the "QoS-Information" (1016) grouped AVP.
 
@@ -1336,8 +1266,7 @@ class QosInformation:
     apn_aggregate_max_bitrate_ul: int = None
     apn_aggregate_max_bitrate_dl: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("qos_class_identifier", AVP_TGPP_QOS_CLASS_IDENTIFIER, VENDOR_TGPP),
         AvpGenDef("max_requested_bandwith_ul", AVP_TGPP_MAX_REQUESTED_BANDWIDTH_UL, VENDOR_TGPP),
         AvpGenDef("max_requested_bandwith_dl", AVP_TGPP_MAX_REQUESTED_BANDWIDTH_DL, VENDOR_TGPP),
@@ -1349,7 +1278,7 @@ class QosInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RecipientAddress:
     """A data container that represents the "Recipient-Address" (1201) grouped AVP.
 
@@ -1360,16 +1289,12 @@ class RecipientAddress:
     address_domain: AddressDomain = None
     addressee_type: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
-        AvpGenDef("address_type", AVP_TGPP_ADDRESS_TYPE, VENDOR_TGPP),
-        AvpGenDef("address_data", AVP_TGPP_ADDRESS_DATA, VENDOR_TGPP),
-        AvpGenDef("address_domain", AVP_TGPP_ADDRESS_DOMAIN, VENDOR_TGPP, type_class=AddressDomain),
+    avp_def: ClassVar[AvpGenType] = OriginatorAddress.avp_def + (
         AvpGenDef("addressee_type", AVP_TGPP_ADDRESSEE_TYPE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AdditionalContentInformation:
     """A data container that represents the "Additional-Content-Information" (1207) grouped AVP.
 
@@ -1379,15 +1304,14 @@ class AdditionalContentInformation:
     additional_type_information: str = None
     content_size: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("type_number", AVP_TGPP_TYPE_NUMBER, VENDOR_TGPP),
         AvpGenDef("additional_type_information", AVP_TGPP_ADDITIONAL_TYPE_INFORMATION, VENDOR_TGPP),
         AvpGenDef("content_size", AVP_TGPP_CONTENT_SIZE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MmContentType:
     """A data container that represents the "MM-Content-Type" (1203) grouped AVP.
 
@@ -1398,16 +1322,12 @@ class MmContentType:
     content_size: int = None
     additional_content_information: list[AdditionalContentInformation] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
-        AvpGenDef("type_number", AVP_TGPP_TYPE_NUMBER, VENDOR_TGPP),
-        AvpGenDef("additional_type_information", AVP_TGPP_ADDITIONAL_TYPE_INFORMATION, VENDOR_TGPP),
-        AvpGenDef("content_size", AVP_TGPP_CONTENT_SIZE, VENDOR_TGPP),
+    avp_def: ClassVar[AvpGenType] = AdditionalContentInformation.avp_def + (
         AvpGenDef("additional_content_information", AVP_TGPP_ADDITIONAL_CONTENT_INFORMATION, VENDOR_TGPP, type_class=AdditionalContentInformation),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MessageClass:
     """A data container that represents the "Message-Class" (1213) grouped AVP.
 
@@ -1416,14 +1336,13 @@ class MessageClass:
     class_identifier: int = None
     token_text: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("class_identifier", AVP_TGPP_CLASS_IDENTIFIER, VENDOR_TGPP),
         AvpGenDef("token_text", AVP_TGPP_TOKEN_TEXT, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ServiceSpecificInfo:
     """A data container that represents the "Service-Specific-Info" (1249) grouped AVP.
 
@@ -1432,14 +1351,13 @@ class ServiceSpecificInfo:
     service_specific_data: str = None
     service_specific_type: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("service_specific_data", AVP_TGPP_SERVICE_SPECIFIC_DATA, VENDOR_TGPP),
         AvpGenDef("service_specific_type", AVP_TGPP_SERVICE_SPECIFIC_TYPE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class PocUserRole:
     """A data container that represents the "PoC-User-Role" (1252) grouped AVP.
 
@@ -1448,14 +1366,13 @@ class PocUserRole:
     poc_user_role_ids: str = None
     poc_user_role_info_units: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("poc_user_role_ids", AVP_TGPP_POC_USER_ROLE_IDS, VENDOR_TGPP),
         AvpGenDef("poc_user_role_info_units", AVP_TGPP_POC_USER_ROLE_INFO_UNITS, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TalkBurstExchange:
     """A data container that represents the "Talk-Burst-Exchange" (1255) grouped AVP.
 
@@ -1471,8 +1388,7 @@ class TalkBurstExchange:
     number_of_participants: int = None
     poc_change_condition: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("poc_change_time", AVP_TGPP_POC_CHANGE_TIME, VENDOR_TGPP, is_required=True),
         AvpGenDef("number_of_talk_bursts", AVP_TGPP_NUMBER_OF_TALK_BURSTS, VENDOR_TGPP),
         AvpGenDef("talk_burst_volume", AVP_TGPP_TALK_BURST_VOLUME, VENDOR_TGPP),
@@ -1485,7 +1401,7 @@ class TalkBurstExchange:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ParticipantGroup:
     """A data container that represents the "Participant-Group" (1260) grouped AVP.
 
@@ -1495,15 +1411,14 @@ class ParticipantGroup:
     participant_access_priority: int = None
     user_participating_type: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("called_party_address", AVP_TGPP_CALLED_PARTY_ADDRESS, VENDOR_TGPP),
         AvpGenDef("participant_access_priority", AVP_TGPP_PARTICIPANT_ACCESS_PRIORITY, VENDOR_TGPP),
         AvpGenDef("user_participating_type", AVP_TGPP_USER_PARTICIPATING_TYPE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class Trigger:
     """A data container that represents the "Trigger" (1264) grouped AVP.
 
@@ -1511,13 +1426,12 @@ class Trigger:
     """
     trigger_type: list[int] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("trigger_type", AVP_TGPP_TRIGGER_TYPE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class Envelope:
     """A data container that represents the "Envelope" (1266) grouped AVP.
 
@@ -1530,8 +1444,7 @@ class Envelope:
     cc_output_octets: int = None
     cc_service_specific_units: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("envelope_start_time", AVP_TGPP_ENVELOPE_START_TIME, VENDOR_TGPP, is_required=True),
         AvpGenDef("envelope_end_time", AVP_TGPP_ENVELOPE_END_TIME, VENDOR_TGPP),
         AvpGenDef("cc_total_octets", AVP_CC_TOTAL_OCTETS),
@@ -1541,7 +1454,7 @@ class Envelope:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TimeQuotaMechanism:
     """A data container that represents the "Time-Quota-Mechanism" (1270) grouped AVP.
 
@@ -1550,14 +1463,13 @@ class TimeQuotaMechanism:
     time_quota_type: int = None
     base_time_interval: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("time_quota_type", AVP_TGPP_TIME_QUOTA_TYPE, VENDOR_TGPP, is_required=True),
         AvpGenDef("base_time_interval", AVP_TGPP_BASE_TIME_INTERVAL, VENDOR_TGPP, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class SdpTimestamps:
     """A data container that represents the "SDP-Timestamps" (1273) grouped AVP.
 
@@ -1566,14 +1478,13 @@ class SdpTimestamps:
     sdp_offer_timestamp: datetime.datetime = None
     sdp_answer_timestamp: datetime.datetime = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("sdp_offer_timestamp", AVP_TGPP_SDP_OFFER_TIMESTAMP, VENDOR_TGPP),
         AvpGenDef("sdp_answer_timestamp", AVP_TGPP_SDP_ANSWER_TIMESTAMP, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class EarlyMediaDescription:
     """A data container that represents the "Early-Media-Description" (1272) grouped AVP.
 
@@ -1583,15 +1494,14 @@ class EarlyMediaDescription:
     sdp_media_component: list[SdpMediaComponent] = dataclasses.field(default_factory=list)
     sdp_session_description: list[str] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("sdp_timestamps", AVP_TGPP_SDP_TIMESTAMPS, VENDOR_TGPP, type_class=SdpTimestamps),
         AvpGenDef("sdp_media_component", AVP_TGPP_SDP_MEDIA_COMPONENT, VENDOR_TGPP, type_class=SdpMediaComponent),
         AvpGenDef("sdp_session_description", AVP_TGPP_SDP_SESSION_DESCRIPTION, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AfCorrelationInformation:
     """A data container that represents the "AF-Correlation-Information" (1276) grouped AVP.
 
@@ -1600,14 +1510,13 @@ class AfCorrelationInformation:
     af_charging_identifier: bytes = None
     flows: list[Flows] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("af_charging_identifier", AVP_TGPP_AF_CHARGING_IDENTIFIER, VENDOR_TGPP, is_required=True),
         AvpGenDef("flows", AVP_TGPP_FLOWS, VENDOR_TGPP, type_class=Flows),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RanSecondaryRatUsageReport:
     """A data container that represents the "RAN-Secondary-RAT-Usage-Report" (1302) grouped AVP.
 
@@ -1620,8 +1529,7 @@ class RanSecondaryRatUsageReport:
     accounting_output_octets: int = None
     tgpp_charging_id: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("secondary_rat_type", AVP_TGPP_SECONDARY_RAT_TYPE, VENDOR_TGPP),
         AvpGenDef("ran_start_timestamp", AVP_TGPP_RAN_START_TIMESTAMP, VENDOR_TGPP),
         AvpGenDef("ran_end_timestamp", AVP_TGPP_RAN_END_TIMESTAMP, VENDOR_TGPP),
@@ -1631,7 +1539,7 @@ class RanSecondaryRatUsageReport:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class WlanOperatorId:
     """A data container that represents the "WLAN-Operator-Id" (1306) grouped AVP.
 
@@ -1640,14 +1548,13 @@ class WlanOperatorId:
     wlan_plmn_id: str = None
     wlan_operator_name: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("wlan_plmn_id", AVP_TGPP_WLAN_PLMN_ID, VENDOR_TGPP),
         AvpGenDef("wlan_operator_name", AVP_TGPP_WLAN_OPERATOR_NAME, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class VolteInformation:
     """A data container that represents the "VoLTE-Information" (1323) grouped AVP.
 
@@ -1656,14 +1563,13 @@ class VolteInformation:
     calling_party_address: str = None
     callee_information: CalleeInformation = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("calling_party_address", AVP_TGPP_CALLING_PARTY_ADDRESS, VENDOR_TGPP),
         AvpGenDef("callee_information", AVP_TGPP_CALLEE_INFORMATION, VENDOR_TGPP, type_class=CalleeInformation),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TerminalInformation:
     """A data container that represents the "Terminal-Information" (1401) grouped AVP.
 
@@ -1674,17 +1580,17 @@ class TerminalInformation:
     software_version: str = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("imei", AVP_TGPP_IMEI, VENDOR_TGPP),
         AvpGenDef("tgpp2_meid", AVP_TGPP_3GPP2_MEID, VENDOR_TGPP),
         AvpGenDef("software_version", AVP_TGPP_SOFTWARE_VERSION, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
-class DestinationInterface:
-    """A data container that represents the "Destination-Interface" (2002) grouped AVP.
+@dataclasses.dataclass(slots=True, weakref_slot=True)
+class Interface:
+    """The common attributes of the Destination-Interface and
+    Originator-Interface grouped AVPs.
 
     3GPP TS 32.299 version 16.2.0
     """
@@ -1693,8 +1599,7 @@ class DestinationInterface:
     interface_port: str = None
     interface_type: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("interface_id", AVP_TGPP_INTERFACE_ID, VENDOR_TGPP),
         AvpGenDef("interface_text", AVP_TGPP_INTERFACE_TEXT, VENDOR_TGPP),
         AvpGenDef("interface_port", AVP_TGPP_INTERFACE_PORT, VENDOR_TGPP),
@@ -1702,27 +1607,25 @@ class DestinationInterface:
     )
 
 
-@dataclasses.dataclass
-class OriginatorInterface:
-    """A data container that represents the "Originator-Interface" (2009) grouped AVP.
+@dataclasses.dataclass(slots=True, weakref_slot=True)
+class DestinationInterface(Interface):
+    """A data container that represents the "Destination-Interface" (2002) grouped AVP.
 
     3GPP TS 32.299 version 16.2.0
     """
-    interface_id: str = None
-    interface_text: str = None
-    interface_port: str = None
-    interface_type: int = None
+    pass
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
-        AvpGenDef("interface_id", AVP_TGPP_INTERFACE_ID, VENDOR_TGPP),
-        AvpGenDef("interface_text", AVP_TGPP_INTERFACE_TEXT, VENDOR_TGPP),
-        AvpGenDef("interface_port", AVP_TGPP_INTERFACE_PORT, VENDOR_TGPP),
-        AvpGenDef("interface_type", AVP_TGPP_INTERFACE_TYPE, VENDOR_TGPP),
-    )
 
+@dataclasses.dataclass(slots=True, weakref_slot=True)
+class OriginatorInterface(Interface):
+    """A data container that represents the "Originator-Interface" (2009) grouped AVP.
 
-@dataclasses.dataclass
+    3GPP TS 32.299 version 16.2.0
+    """
+    pass
+
+
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RemainingBalance:
     """A data container that represents the "Remaining-Balance" (2021) grouped AVP.
 
@@ -1731,16 +1634,16 @@ class RemainingBalance:
     unit_value: UnitValue = None
     currency_code: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("unit_value", AVP_UNIT_VALUE, is_required=True, type_class=UnitValue),
         AvpGenDef("currency_code", AVP_CURRENCY_CODE, is_required=True),
     )
 
 
-@dataclasses.dataclass
-class OriginatorReceivedAddress:
-    """A data container that represents the "Originator-Received-Address" (2027) grouped AVP.
+@dataclasses.dataclass(slots=True, weakref_slot=True)
+class ReceivedAddress:
+    """The common attributes of the Originator-Received-Address and
+    Recipient-Received-Address grouped AVPs.
 
     3GPP TS 32.299 version 16.2.0
     """
@@ -1748,33 +1651,32 @@ class OriginatorReceivedAddress:
     address_data: str = None
     address_domain: AddressDomain = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("address_type", AVP_TGPP_ADDRESS_TYPE, VENDOR_TGPP),
         AvpGenDef("address_data", AVP_TGPP_ADDRESS_DATA, VENDOR_TGPP),
         AvpGenDef("address_domain", AVP_TGPP_ADDRESS_DOMAIN, VENDOR_TGPP, type_class=AddressDomain),
     )
 
 
-@dataclasses.dataclass
-class RecipientReceivedAddress:
-    """A data container that represents the "Recipient-Received-Address" (2028) grouped AVP.
+@dataclasses.dataclass(slots=True, weakref_slot=True)
+class OriginatorReceivedAddress(ReceivedAddress):
+    """A data container that represents the "Originator-Received-Address" (2027) grouped AVP.
 
     3GPP TS 32.299 version 16.2.0
     """
-    address_type: int = None
-    address_data: str = None
-    address_domain: AddressDomain = None
+    pass
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
-        AvpGenDef("address_type", AVP_TGPP_ADDRESS_TYPE, VENDOR_TGPP),
-        AvpGenDef("address_data", AVP_TGPP_ADDRESS_DATA, VENDOR_TGPP),
-        AvpGenDef("address_domain", AVP_TGPP_ADDRESS_DOMAIN, VENDOR_TGPP, type_class=AddressDomain),
-    )
 
+@dataclasses.dataclass(slots=True, weakref_slot=True)
+class RecipientReceivedAddress(ReceivedAddress):
+    """A data container that represents the "Recipient-Received-Address" (2028) grouped AVP.
 
-@dataclasses.dataclass
+    3GPP TS 32.299 version 16.2.0
+    """
+    pass
+
+
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RecipientInfo:
     """A data container that represents the "Recipient-Info" (2026) grouped AVP.
 
@@ -1786,8 +1688,7 @@ class RecipientInfo:
     recipient_sccp_address: str = None
     sm_protocol_id: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("destination_interface", AVP_TGPP_DESTINATION_INTERFACE, VENDOR_TGPP, type_class=DestinationInterface),
         AvpGenDef("recipient_address", AVP_TGPP_RECIPIENT_ADDRESS, VENDOR_TGPP, type_class=RecipientAddress),
         AvpGenDef("recipient_received_address", AVP_TGPP_RECIPIENT_RECEIVED_ADDRESS, VENDOR_TGPP, type_class=RecipientReceivedAddress),
@@ -1796,7 +1697,7 @@ class RecipientInfo:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class UserCsgInformation:
     """A data container that represents the "User-CSG-Information" (2319) grouped AVP.
 
@@ -1806,15 +1707,14 @@ class UserCsgInformation:
     csg_access_mode: int = None
     csg_membership_indication: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("csg_id", AVP_TGPP_CSG_ID, VENDOR_TGPP),
         AvpGenDef("csg_access_mode", AVP_TGPP_CSG_ACCESS_MODE, VENDOR_TGPP),
         AvpGenDef("csg_membership_indication", AVP_TGPP_CSG_MEMBERSHIP_INDICATION, VENDOR_TGPP)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ServingNode:
     """A data container that represents the "Serving-Node" (2401) grouped AVP.
 
@@ -1831,8 +1731,7 @@ class ServingNode:
     gmlc_address: str = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("sgsn_number", AVP_TGPP_SGSN_NUMBER, VENDOR_TGPP),
         AvpGenDef("sgsn_name", AVP_TGPP_SGSN_NAME, VENDOR_TGPP),
         AvpGenDef("sgsn_realm", AVP_TGPP_SGSN_REALM, VENDOR_TGPP),
@@ -1845,7 +1744,7 @@ class ServingNode:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class NniInformation:
     """A data container that represents the "NNI-Information" (2703) grouped AVP.
 
@@ -1856,8 +1755,7 @@ class NniInformation:
     relationship_mode: int = None
     neighbour_node_address: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("session_direction", AVP_TGPP_SESSION_DIRECTION, VENDOR_TGPP),
         AvpGenDef("nni_type", AVP_TGPP_NNI_TYPE, VENDOR_TGPP),
         AvpGenDef("relationship_mode", AVP_TGPP_RELATIONSHIP_MODE, VENDOR_TGPP),
@@ -1865,7 +1763,7 @@ class NniInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AccessTransferInformation:
     """A data container that represents the "Access-Transfer-Information" (2709) grouped AVP.
 
@@ -1881,8 +1779,7 @@ class AccessTransferInformation:
     related_ims_charging_identifier_node: str = None
     change_time: datetime.datetime = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("access_transfer_type", AVP_TGPP_ACCESS_TRANSFER_TYPE, VENDOR_TGPP),
         AvpGenDef("access_network_information", AVP_TGPP_ACCESS_NETWORK_INFORMATION, VENDOR_TGPP),
         AvpGenDef("cellular_network_information", AVP_TGPP_CELLULAR_NETWORK_INFORMATION, VENDOR_TGPP),
@@ -1895,7 +1792,7 @@ class AccessTransferInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TwanUserLocationInfo:
     """A data container that represents the "TWAN-User-Location-Info" (2714) grouped AVP.
 
@@ -1907,8 +1804,7 @@ class TwanUserLocationInfo:
     wlan_operator_id: WlanOperatorId = None
     logical_access_id: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("ssid", AVP_TGPP_SSID, VENDOR_TGPP, is_required=True),
         AvpGenDef("bssid", AVP_TGPP_BSSID, VENDOR_TGPP),
         AvpGenDef("civic_address_information", AVP_TGPP_CIVIC_ADDRESS_INFORMATION, VENDOR_TGPP),
@@ -1917,7 +1813,7 @@ class TwanUserLocationInfo:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class PresenceReportingAreaInformation:
     """A data container that represents the "Presence-Reporting-Area-Information" (2822) grouped AVP.
 
@@ -1928,15 +1824,14 @@ class PresenceReportingAreaInformation:
     presence_reporting_area_elements_list: bytes = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("presence_reporting_area_identifier", AVP_TGPP_PRESENCE_REPORTING_AREA_IDENTIFIER, VENDOR_TGPP),
         AvpGenDef("presence_reporting_area_status", AVP_TGPP_PRESENCE_REPORTING_AREA_STATUS, VENDOR_TGPP),
         AvpGenDef("presence_reporting_area_elements_list", AVP_TGPP_PRESENCE_REPORTING_AREA_ELEMENTS_LIST, VENDOR_TGPP)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class PolicyCounterStatusReport:
     """A data container that represents the "Policy-Counter-Status-Report" (2903) grouped AVP.
 
@@ -1946,14 +1841,13 @@ class PolicyCounterStatusReport:
     policy_counter_status: str = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("policy_counter_identifier", AVP_TGPP_POLICY_COUNTER_IDENTIFIER, VENDOR_TGPP, is_required=True),
         AvpGenDef("policy_counter_status", AVP_TGPP_POLICY_COUNTER_STATUS, VENDOR_TGPP, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class SmDeviceTriggerInformation:
     """A data container that represents the "SM-Device-Trigger-Information" (3405) grouped AVP.
 
@@ -1966,8 +1860,7 @@ class SmDeviceTriggerInformation:
     priority_indication: int = None
     application_port_identifier: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mtc_iwf_address", AVP_TGPP_MTC_IWF_ADDRESS, VENDOR_TGPP),
         AvpGenDef("reference_number", AVP_TGPP_REFERENCE_NUMBER, VENDOR_TGPP),
         AvpGenDef("serving_node", AVP_TGPP_SERVING_NODE, VENDOR_TGPP, type_class=ServingNode),
@@ -1977,7 +1870,7 @@ class SmDeviceTriggerInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class EnhancedDiagnostics:
     """A data container that represents the "Enhanced-Diagnostics" (3901) grouped AVP.
 
@@ -1985,13 +1878,12 @@ class EnhancedDiagnostics:
     """
     ran_nas_release_cause: list[bytes] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("ran_nas_release_cause", AVP_TGPP_RAN_NAS_RELEASE_CAUSE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class VariablePart:
     """A data container that represents the "Variable-Part" (3907) grouped AVP.
 
@@ -2001,15 +1893,14 @@ class VariablePart:
     variable_part_type: int = None
     variable_part_value: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("variable_part_order", AVP_TGPP_VARIABLE_PART_ORDER, VENDOR_TGPP),
         AvpGenDef("variable_part_type", AVP_TGPP_VARIABLE_PART_TYPE, VENDOR_TGPP, is_required=True),
         AvpGenDef("variable_part_value", AVP_TGPP_VARIABLE_PART_VALUE, VENDOR_TGPP, is_required=True),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AnnouncementInformation:
     """A data container that represents the "Announcement-Information" (3904) grouped AVP.
 
@@ -2024,8 +1915,7 @@ class AnnouncementInformation:
     privacy_indicator: int = None
     language: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("announcement_identifier", AVP_TGPP_ANNOUNCEMENT_IDENTIFIER, VENDOR_TGPP, is_required=True),
         AvpGenDef("variable_part", AVP_TGPP_VARIABLE_PART, VENDOR_TGPP, type_class=VariablePart),
         AvpGenDef("time_indicator", AVP_TGPP_TIME_INDICATOR, VENDOR_TGPP),
@@ -2037,7 +1927,7 @@ class AnnouncementInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class CalledIdentityChange:
     """A data container that represents the "Called-Identity-Change" (3917) grouped AVP.
 
@@ -2046,14 +1936,13 @@ class CalledIdentityChange:
     called_identity: str = None
     change_time: datetime.datetime = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("called_identity", AVP_TGPP_CALLED_IDENTITY, VENDOR_TGPP),
         AvpGenDef("change_time", AVP_TGPP_CHANGE_TIME, VENDOR_TGPP)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class UwanUserLocationInfo:
     """A data container that represents the "UWAN-User-Location-Info" (3918) grouped AVP.
 
@@ -2067,8 +1956,7 @@ class UwanUserLocationInfo:
     civic_address_information: str = None
     wlan_operator_id: WlanOperatorId = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("ue_local_ip_address", AVP_TGPP_UE_LOCAL_IP_ADDRESS, VENDOR_TGPP, is_required=True),
         AvpGenDef("udp_source_port", AVP_TGPP_UDP_SOURCE_PORT, VENDOR_TGPP),
         AvpGenDef("ssid", AVP_TGPP_SSID, VENDOR_TGPP),
@@ -2079,7 +1967,7 @@ class UwanUserLocationInfo:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RelatedChangeConditionInformation:
     """A data container that represents the "Related-Change-Condition-Information" (3925) grouped AVP.
 
@@ -2094,20 +1982,19 @@ class RelatedChangeConditionInformation:
     user_csg_information: UserCsgInformation = None
     tgpp_rat_type: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("sgsn_address", AVP_TGPP_SGSN_ADDRESS, VENDOR_TGPP),
         AvpGenDef("change_condition", AVP_TGPP_CHANGE_CONDITION, VENDOR_TGPP),
         AvpGenDef("tgpp_user_location_info", AVP_TGPP_3GPP_USER_LOCATION_INFO, VENDOR_TGPP),
         AvpGenDef("tgpp2_bsid", AVP_TGPP2_3GPP2_BSID, VENDOR_TGPP2),
         AvpGenDef("uwan_user_location_info", AVP_TGPP_UWAN_USER_LOCATION_INFO, VENDOR_TGPP, type_class=UwanUserLocationInfo),
-        AvpGenDef("presence_reporting_area_information", AVP_TGPP_PRESENCE_REPORTING_AREA_INFORMATION, VENDOR_TGPP, type_class=PresenceReportingAreaInformation),
+        AvpGenDef("presence_reporting_area_status", AVP_TGPP_PRESENCE_REPORTING_AREA_STATUS, VENDOR_TGPP),
         AvpGenDef("user_csg_information", AVP_TGPP_USER_CSG_INFORMATION, VENDOR_TGPP, type_class=UserCsgInformation),
         AvpGenDef("tgpp_rat_type", AVP_TGPP_3GPP_RAT_TYPE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ApnRateControlUplink:
     """A data container that represents the "APN-Rate-Control-Uplink" (3934) grouped AVP.
 
@@ -2117,15 +2004,14 @@ class ApnRateControlUplink:
     rate_control_max_rate: int = None
     rate_control_max_message_size: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("rate_control_time_unit", AVP_TGPP_RATE_CONTROL_TIME_UNIT, VENDOR_TGPP),
         AvpGenDef("rate_control_max_rate", AVP_TGPP_RATE_CONTROL_MAX_RATE, VENDOR_TGPP),
         AvpGenDef("rate_control_max_message_size", AVP_TGPP_RATE_CONTROL_MAX_MESSAGE_SIZE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ApnRateControlDownlink:
     """A data container that represents the "APN-Rate-Control-Downlink" (3935) grouped AVP.
 
@@ -2135,15 +2021,14 @@ class ApnRateControlDownlink:
     rate_control_time_unit: int = None
     rate_control_max_rate: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("additional_exception_reports", AVP_TGPP_ADDITIONAL_EXCEPTION_REPORTS, VENDOR_TGPP),
         AvpGenDef("rate_control_time_unit", AVP_TGPP_RATE_CONTROL_TIME_UNIT, VENDOR_TGPP),
         AvpGenDef("rate_control_max_rate", AVP_TGPP_RATE_CONTROL_MAX_RATE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ApnRateControl:
     """A data container that represents the "APN-Rate-Control" (3933) grouped AVP.
 
@@ -2152,14 +2037,13 @@ class ApnRateControl:
     apn_rate_control_uplink: ApnRateControlUplink = None
     apn_rate_control_downlink: ApnRateControlDownlink = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("apn_rate_control_uplink", AVP_TGPP_APN_RATE_CONTROL_UPLINK, VENDOR_TGPP, type_class=ApnRateControlUplink),
         AvpGenDef("apn_rate_control_downlink", AVP_TGPP_APN_RATE_CONTROL_DOWNLINK, VENDOR_TGPP, type_class=ApnRateControlDownlink),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ServingPlmnRateControl:
     """A data container that represents the "Serving-PLMN-Rate-Control" (4310) grouped AVP.
 
@@ -2169,14 +2053,13 @@ class ServingPlmnRateControl:
     downlink_rate_limit: int = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("uplink_rate_limit", AVP_TGPP_UPLINK_RATE_LIMIT, VENDOR_TGPP),
         AvpGenDef("downlink_rate_limit", AVP_TGPP_DOWNLINK_RATE_LIMIT, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AccessNetworkInfoChange:
     """A data container that represents the "Access-Network-Info-Change" (4401) grouped AVP.
 
@@ -2186,15 +2069,14 @@ class AccessNetworkInfoChange:
     cellular_network_information: bytes = None
     change_time: datetime.datetime = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("access_network_information", AVP_TGPP_ACCESS_NETWORK_INFORMATION, VENDOR_TGPP),
         AvpGenDef("cellular_network_information", AVP_TGPP_CELLULAR_NETWORK_INFORMATION, VENDOR_TGPP),
         AvpGenDef("change_time", AVP_TGPP_CHANGE_TIME, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ServiceDataContainer:
     """A data container that represents the "Traffic-Data-Volumes" (2040) grouped AVP.
 
@@ -2234,8 +2116,7 @@ class ServiceDataContainer:
     traffic_steering_policy_identifier_ul: bytes = None
     volte_information: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("af_correlation_information", AVP_TGPP_AF_CORRELATION_INFORMATION, VENDOR_TGPP, type_class=AfCorrelationInformation),
         AvpGenDef("charging_rule_base_name", AVP_TGPP_CHARGING_RULE_BASE_NAME, VENDOR_TGPP),
         AvpGenDef("accounting_input_octets", AVP_ACCOUNTING_INPUT_OCTETS),
@@ -2267,12 +2148,12 @@ class ServiceDataContainer:
         AvpGenDef("apn_rate_control", AVP_TGPP_APN_RATE_CONTROL, VENDOR_TGPP, type_class=ApnRateControl),
         AvpGenDef("tgpp_ps_data_off_status", AVP_TGPP_3GPP_PS_DATA_OFF_STATUS, VENDOR_TGPP),
         AvpGenDef("traffic_steering_policy_identifier_dl", AVP_TGPP_TRAFFIC_STEERING_POLICY_IDENTIFIER_DL, VENDOR_TGPP),
-        AvpGenDef("traffic_steering_policy_identifier_dl", AVP_TGPP_TRAFFIC_STEERING_POLICY_IDENTIFIER_UL, VENDOR_TGPP),
+        AvpGenDef("traffic_steering_policy_identifier_ul", AVP_TGPP_TRAFFIC_STEERING_POLICY_IDENTIFIER_UL, VENDOR_TGPP),
         AvpGenDef("volte_information", AVP_TGPP_VOLTE_INFORMATION, VENDOR_TGPP, type_class=VolteInformation),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TrafficDataVolumes:
     """A data container that represents the "Traffic-Data-Volumes" (2046) grouped AVP.
 
@@ -2298,8 +2179,7 @@ class TrafficDataVolumes:
     serving_plmn_rate_control: ServingPlmnRateControl = None
     apn_rate_control: ApnRateControl = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("qos_information", AVP_TGPP_QOS_INFORMATION, VENDOR_TGPP, type_class=QosInformation),
         AvpGenDef("accounting_input_octets", AVP_ACCOUNTING_INPUT_OCTETS),
         AvpGenDef("accounting_output_octets", AVP_ACCOUNTING_OUTPUT_OCTETS),
@@ -2322,7 +2202,7 @@ class TrafficDataVolumes:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class FixedUserLocationInfo:
     """A data container that represents the "Fixed-User-Location-Info" (2825) grouped AVP.
 
@@ -2335,8 +2215,7 @@ class FixedUserLocationInfo:
     physical_access_id: str = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("ssid", AVP_TGPP_SSID, VENDOR_TGPP),
         AvpGenDef("bssid", AVP_TGPP_BSSID, VENDOR_TGPP),
         AvpGenDef("logical_access_id", AVP_ETSI_LOGICAL_ACCESS_ID, VENDOR_ETSI),
@@ -2344,7 +2223,7 @@ class FixedUserLocationInfo:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class BasicServiceCode:
     """A data container that represents the "Basic-Service-Code" (3411) grouped AVP.
 
@@ -2353,14 +2232,13 @@ class BasicServiceCode:
     bearer_service: bytes = None
     teleservice: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("bearer_service", AVP_TGPP_BEARER_SERVICE, VENDOR_TGPP),
         AvpGenDef("teleservice", AVP_TGPP_TELESERVICE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class IsupCause:
     """A data container that represents the "ISUP-Cause" (3416) grouped AVP.
 
@@ -2370,15 +2248,14 @@ class IsupCause:
     isup_cause_value: int = None
     isup_cause_diagnostics: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("isup_cause_location", AVP_TGPP_ISUP_CAUSE_LOCATION, VENDOR_TGPP),
         AvpGenDef("isup_cause_value", AVP_TGPP_ISUP_CAUSE_VALUE, VENDOR_TGPP),
         AvpGenDef("isup_cause_diagnostics", AVP_TGPP_ISUP_CAUSE_DIAGNOSTICS, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ProSeDirectCommunicationTransmissionDataContainer:
     """A data container that represents the "ProSe-Direct-Communication-Transmission-Data-Container" (3441) grouped AVP.
 
@@ -2395,8 +2272,7 @@ class ProSeDirectCommunicationTransmissionDataContainer:
     radio_resources_indicator: int = None
     radio_frequency: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("local_sequence_number", AVP_TGPP_LOCAL_SEQUENCE_NUMBER, VENDOR_TGPP),
         AvpGenDef("coverage_status", AVP_TGPP_COVERAGE_STATUS, VENDOR_TGPP),
         AvpGenDef("tgpp_user_location_info", AVP_TGPP_3GPP_USER_LOCATION_INFO, VENDOR_TGPP),
@@ -2410,7 +2286,7 @@ class ProSeDirectCommunicationTransmissionDataContainer:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class LocationInfo:
     """A data container that represents the "Location-Info" (3460) grouped AVP.
 
@@ -2419,14 +2295,13 @@ class LocationInfo:
     tgpp_user_location_info: bytes = None
     change_time: datetime.datetime = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("tgpp_user_location_info", AVP_TGPP_3GPP_USER_LOCATION_INFO, VENDOR_TGPP),
         AvpGenDef("change_time", AVP_TGPP_CHANGE_TIME, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class CoverageInfo:
     """A data container that represents the "Coverage-Info" (3459) grouped AVP.
 
@@ -2436,15 +2311,14 @@ class CoverageInfo:
     change_time: datetime.datetime = None
     location_info: list[LocationInfo] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("coverage_status", AVP_TGPP_COVERAGE_STATUS, VENDOR_TGPP),
         AvpGenDef("change_time", AVP_TGPP_CHANGE_TIME, VENDOR_TGPP),
         AvpGenDef("location_info", AVP_TGPP_LOCATION_INFO, VENDOR_TGPP, type_class=LocationInfo),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ProSeDirectCommunicationReceptionDataContainer:
     """A data container that represents the "ProSe-Direct-Communication-Reception-Data-Container" (3461) grouped AVP.
 
@@ -2461,8 +2335,7 @@ class ProSeDirectCommunicationReceptionDataContainer:
     radio_resources_indicator: int = None
     radio_frequency: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("local_sequence_number", AVP_TGPP_LOCAL_SEQUENCE_NUMBER, VENDOR_TGPP),
         AvpGenDef("coverage_status", AVP_TGPP_COVERAGE_STATUS, VENDOR_TGPP),
         AvpGenDef("tgpp_user_location_info", AVP_TGPP_3GPP_USER_LOCATION_INFO, VENDOR_TGPP),
@@ -2476,7 +2349,7 @@ class ProSeDirectCommunicationReceptionDataContainer:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RadioParameterSetInfo:
     """A data container that represents the "Radio-Parameter-Set-Values" (3463) grouped AVP.
 
@@ -2485,14 +2358,13 @@ class RadioParameterSetInfo:
     radio_parameter_set_values: bytes = None
     change_time: datetime.datetime = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("radio_parameter_set_values", AVP_TGPP_RADIO_PARAMETER_SET_VALUES, VENDOR_TGPP),
         AvpGenDef("change_time", AVP_TGPP_CHANGE_TIME, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TransmitterInfo:
     """A data container that represents the "Transmitter-Info" (3468) grouped AVP.
 
@@ -2501,14 +2373,13 @@ class TransmitterInfo:
     prose_source_ip_address: str = None
     prose_ue_id: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("prose_source_ip_address", AVP_TGPP_PROSE_SOURCE_IP_ADDRESS, VENDOR_TGPP),
         AvpGenDef("prose_ue_id", AVP_TGPP_PROSE_UE_ID, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RelatedTrigger:
     """A data container that represents the "Related-Trigger" (3926) grouped AVP.
 
@@ -2516,13 +2387,12 @@ class RelatedTrigger:
     """
     trigger_type: list[int] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("trigger_type", AVP_TGPP_TRIGGER_TYPE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class NiddSubmission:
     """A data container that represents the "NIDD-Submission" (3928) grouped AVP.
 
@@ -2535,8 +2405,7 @@ class NiddSubmission:
     accounting_output_octets: int = None
     change_condition: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         # AvpGenDef("submission_timestamp", AVP_TGPP_SUBMISSION_TIMESTAMP, VENDOR_TGPP),
         AvpGenDef("event_timestamp", AVP_EVENT_TIMESTAMP),
         AvpGenDef("accounting_input_octets", AVP_ACCOUNTING_INPUT_OCTETS),
@@ -2545,7 +2414,7 @@ class NiddSubmission:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ScsAsAddress:
     """A data container that represents the "SCS-AS-Address" (3940) grouped AVP.
 
@@ -2554,14 +2423,13 @@ class ScsAsAddress:
     scs_realm: bytes = None
     scs_address: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("scs_realm", AVP_TGPP_SCS_REALM, VENDOR_TGPP),
         AvpGenDef("scs_address", AVP_TGPP_SCS_ADDRESS, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RrcCauseCounter:
     """A data container that represents the "RRC-Cause-Counter" (4318) grouped AVP.
 
@@ -2571,14 +2439,13 @@ class RrcCauseCounter:
     rrc_counter_timestamp: datetime.datetime = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("counter_value", AVP_TGPP_COUNTER_VALUE, VENDOR_TGPP),
         AvpGenDef("rrc_counter_timestamp", AVP_TGPP_RRC_COUNTER_TIMESTAMP, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MultipleServicesCreditControl:
     """A data container that represents the "Multiple-Services-Credit-Control" (456) grouped AVP."""
     granted_service_unit: GrantedServiceUnit = None
@@ -2613,8 +2480,7 @@ class MultipleServicesCreditControl:
     related_trigger: RelatedTrigger = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("granted_service_unit", AVP_GRANTED_SERVICE_UNIT, type_class=GrantedServiceUnit),
         AvpGenDef("requested_service_unit", AVP_REQUESTED_SERVICE_UNIT, type_class=RequestedServiceUnit),
         AvpGenDef("used_service_unit", AVP_USED_SERVICE_UNIT, type_class=UsedServiceUnit),
@@ -2647,7 +2513,7 @@ class MultipleServicesCreditControl:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class OfflineCharging:
     """A data container that represents the "Offline-Charging" (1278) grouped AVP.
 
@@ -2659,8 +2525,7 @@ class OfflineCharging:
     multiple_services_credit_control: list[MultipleServicesCreditControl] = dataclasses.field(default_factory=list)
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("quota_consumption_time", AVP_TGPP_QUOTA_CONSUMPTION_TIME, VENDOR_TGPP),
         AvpGenDef("time_quota_mechanism", AVP_TGPP_TIME_QUOTA_MECHANISM, VENDOR_TGPP, type_class=TimeQuotaMechanism),
         AvpGenDef("envelope_reporting", AVP_TGPP_ENVELOPE_REPORTING, VENDOR_TGPP),
@@ -2668,7 +2533,7 @@ class OfflineCharging:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class PsInformation:
     """A data container that represents the "PS-Information" (874) grouped AVP.
 
@@ -2748,8 +2613,7 @@ class PsInformation:
     unused_quota_timer: int = None
     ran_secondary_rat_usage_report: list[RanSecondaryRatUsageReport] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("supported_features", AVP_TGPP_SUPPORTED_FEATURES, VENDOR_TGPP, type_class=SupportedFeatures),
         AvpGenDef("tgpp_charging_id", AVP_TGPP_3GPP_CHARGING_ID, VENDOR_TGPP),
         AvpGenDef("pdn_connection_charging_id", AVP_TGPP_PDN_CONNECTION_ID, VENDOR_TGPP),
@@ -2826,7 +2690,7 @@ class PsInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class SmsInformation:
     """A data container that represents the "SMS-Information" (2000) grouped AVP.
 
@@ -2855,8 +2719,7 @@ class SmsInformation:
     application_port_identifier: int = None
     external_identifier: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("sms_node", AVP_TGPP_SMS_NODE, VENDOR_TGPP),
         AvpGenDef("client_address", AVP_TGPP_CLIENT_ADDRESS, VENDOR_TGPP),
         AvpGenDef("originator_sccp_address", AVP_TGPP_ORIGINATOR_SCCP_ADDRESS, VENDOR_TGPP),
@@ -2882,7 +2745,7 @@ class SmsInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AccumulatedCost:
     """A data container that represents the "Accumulated-Digits" (2052) grouped AVP.
 
@@ -2891,14 +2754,13 @@ class AccumulatedCost:
     value_digits: int = None
     exponent: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("value_digits", AVP_VALUE_DIGITS, is_required=True),
         AvpGenDef("exponent", AVP_EXPONENT),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class IncrementalCost:
     """A data container that represents the "Incremental-Cost" (2062) grouped AVP.
 
@@ -2907,14 +2769,13 @@ class IncrementalCost:
     value_digits: int = None
     exponent: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("value_digits", AVP_VALUE_DIGITS, is_required=True),
         AvpGenDef("exponent", AVP_EXPONENT),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AocCostInformation:
     """A data container that represents the "AoC-Cost-Information" (2053) grouped AVP.
 
@@ -2924,15 +2785,14 @@ class AocCostInformation:
     incremental_cost: list[IncrementalCost] = dataclasses.field(default_factory=list)
     currency_code: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("accumulated_cost", AVP_TGPP_ACCUMULATED_COST, VENDOR_TGPP, type_class=AccumulatedCost),
         AvpGenDef("incremental_cost", AVP_TGPP_INCREMENTAL_COST, VENDOR_TGPP, type_class=IncrementalCost),
         AvpGenDef("currency_code", AVP_CURRENCY_CODE)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class UnitCost:
     """A data container that represents the "Unit-Cost" (2061) grouped AVP.
 
@@ -2941,14 +2801,13 @@ class UnitCost:
     value_digits: int = None
     exponent: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("value_digits", AVP_VALUE_DIGITS, is_required=True),
         AvpGenDef("exponent", AVP_EXPONENT),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RateElement:
     """A data container that represents the "Rate-Element" (2058) grouped AVP.
 
@@ -2960,8 +2819,7 @@ class RateElement:
     unit_cost: UnitCost = None
     unit_quota_threshold: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("cc_unit_type", AVP_CC_UNIT_TYPE, is_required=True),
         AvpGenDef("charge_reason_code", AVP_TGPP_CHARGE_REASON_CODE, VENDOR_TGPP),
         AvpGenDef("unit_value", AVP_UNIT_VALUE, type_class=UnitValue),
@@ -2970,7 +2828,7 @@ class RateElement:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ScaleFactor:
     """A data container that represents the "Scale-Factor" (2059) grouped AVP.
 
@@ -2979,14 +2837,13 @@ class ScaleFactor:
     value_digits: int = None
     exponent: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("value_digits", AVP_VALUE_DIGITS, is_required=True),
         AvpGenDef("exponent", AVP_EXPONENT),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class CurrentTariff:
     """A data container that represents the "Current-Tariff" (2056) grouped AVP.
 
@@ -2996,8 +2853,7 @@ class CurrentTariff:
     scale_factor: ScaleFactor = None
     rate_element: list[RateElement] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("currency_code", AVP_CURRENCY_CODE),
         AvpGenDef("scale_factor", AVP_TGPP_SCALE_FACTOR, VENDOR_TGPP, type_class=ScaleFactor),
         AvpGenDef("rate_element", AVP_TGPP_RATE_ELEMENT, VENDOR_TGPP, type_class=RateElement),
@@ -3005,7 +2861,7 @@ class CurrentTariff:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class NextTariff:
     """A data container that represents the "Next-Tariff" (2057) grouped AVP.
 
@@ -3015,8 +2871,7 @@ class NextTariff:
     scale_factor: ScaleFactor = None
     rate_element: list[RateElement] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("currency_code", AVP_CURRENCY_CODE),
         AvpGenDef("scale_factor", AVP_TGPP_SCALE_FACTOR, VENDOR_TGPP, type_class=ScaleFactor),
         AvpGenDef("rate_element", AVP_TGPP_RATE_ELEMENT, VENDOR_TGPP, type_class=RateElement),
@@ -3024,7 +2879,7 @@ class NextTariff:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class TariffInformation:
     """A data container that represents the "Tariff-Information" (2060) grouped AVP.
 
@@ -3034,15 +2889,14 @@ class TariffInformation:
     tariff_time_change: datetime.datetime = None
     next_tariff: NextTariff = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("current_tariff", AVP_TGPP_CURRENT_TARIFF, VENDOR_TGPP, type_class=CurrentTariff),
         AvpGenDef("tariff_time_change", AVP_TARIFF_TIME_CHANGE),
         AvpGenDef("next_tariff", AVP_TGPP_NEXT_TARIFF, VENDOR_TGPP, type_class=NextTariff)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class RealTimeTariffInformation:
     """A data container that represents the "Real-Time-Tariff-Information" (2305) grouped AVP.
 
@@ -3051,14 +2905,13 @@ class RealTimeTariffInformation:
     tariff_information: TariffInformation = None
     tariff_xml: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("tariff_information", AVP_TGPP_TARIFF_INFORMATION, VENDOR_TGPP, type_class=TariffInformation),
         AvpGenDef("tariff_xml", AVP_TGPP_TARIFF_XML, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AocService:
     """A data container that represents the "AoC-Service" (2311) grouped AVP.
 
@@ -3067,14 +2920,13 @@ class AocService:
     aoc_service_obligatory_type: int = None
     aoc_service_type: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("aoc_service_obligatory_type", AVP_TGPP_AOC_SERVICE_OBLIGATORY_TYPE, VENDOR_TGPP),
         AvpGenDef("aoc_service_type", AVP_TGPP_AOC_SERVICE_TYPE, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AocSubscriptionInformation:
     """A data container that represents the "AoC-Subscription-Information" (2314) grouped AVP.
 
@@ -3084,15 +2936,14 @@ class AocSubscriptionInformation:
     aoc_format: int = None
     preferred_aoc_currency: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("aoc_service", AVP_TGPP_AOC_SERVICE, VENDOR_TGPP, type_class=AocService),
         AvpGenDef("aoc_format", AVP_TGPP_AOC_FORMAT, VENDOR_TGPP),
         AvpGenDef("preferred_aoc_currency", AVP_TGPP_PREFERRED_AOC_CURRENCY, VENDOR_TGPP)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AocInformation:
     """A data container that represents the "AoC-Information" (2054) grouped AVP.
 
@@ -3102,15 +2953,14 @@ class AocInformation:
     tariff_information: TariffInformation = None
     aoc_subscription_information: AocSubscriptionInformation = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("aoc_cost_information", AVP_TGPP_AOC_COST_INFORMATION, VENDOR_TGPP, type_class=AocCostInformation),
         AvpGenDef("tariff_information", AVP_TGPP_TARIFF_INFORMATION, VENDOR_TGPP, type_class=TariffInformation),
         AvpGenDef("aoc_subscription_information", AVP_TGPP_AOC_SUBSCRIPTION_INFORMATION, VENDOR_TGPP, type_class=AocSubscriptionInformation)
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class SupplementaryService:
     """A data container that represents the "Supplementary-Service" (2048) grouped AVP.
 
@@ -3127,8 +2977,7 @@ class SupplementaryService:
     cug_information: bytes = None
     aoc_information: AocInformation = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("mmtel_service_type", AVP_TGPP_MMTEL_SERVICE_TYPE, VENDOR_TGPP),
         AvpGenDef("service_mode", AVP_TGPP_SERVICE_MODE, VENDOR_TGPP),
         AvpGenDef("number_of_diversions", AVP_TGPP_NUMBER_OF_DIVERSIONS, VENDOR_TGPP),
@@ -3142,7 +2991,7 @@ class SupplementaryService:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MmtelInformation:
     """A data container that represents the "MMTel-Information" (2030) grouped AVP.
 
@@ -3150,13 +2999,12 @@ class MmtelInformation:
     """
     supplementary_service: list[SupplementaryService] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("supplementary_service", AVP_TGPP_SUPPLEMENTARY_SERVICE, VENDOR_TGPP, type_class=SupplementaryService),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ImsInformation:
     """A data container that represents the "IMS-Information" (876) grouped AVP.
 
@@ -3216,8 +3064,7 @@ class ImsInformation:
     tad_identifier: int = None
     fe_identifier_list: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("event_type", AVP_TGPP_EVENT_TYPE, VENDOR_TGPP, type_class=EventType),
         AvpGenDef("role_of_node", AVP_TGPP_ROLE_OF_NODE, VENDOR_TGPP),
         AvpGenDef("node_functionality", AVP_TGPP_NODE_FUNCTIONALITY, VENDOR_TGPP, is_required=True),
@@ -3274,7 +3121,7 @@ class ImsInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MmsInformation:
     """A data container that represents the "Service-Information" (877) grouped AVP.
 
@@ -3301,8 +3148,7 @@ class MmsInformation:
     vasp_id: str = None
     vas_id: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("originator_address", AVP_TGPP_ORIGINATOR_ADDRESS, VENDOR_TGPP, type_class=OriginatorAddress),
         AvpGenDef("recipient_address", AVP_TGPP_RECIPIENT_ADDRESS, VENDOR_TGPP, type_class=RecipientAddress),
         AvpGenDef("submission_time", AVP_TGPP_SUBMISSION_TIME, VENDOR_TGPP),
@@ -3326,7 +3172,7 @@ class MmsInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class PocInformation:
     """A data container that represents the "PoC-Information" (879) grouped AVP.
 
@@ -3347,8 +3193,7 @@ class PocInformation:
     poc_session_id: str = None
     charged_party: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("poc_server_role", AVP_TGPP_POC_SERVER_ROLE, VENDOR_TGPP),
         AvpGenDef("poc_session_type", AVP_TGPP_POC_SESSION_TYPE, VENDOR_TGPP),
         AvpGenDef("poc_user_role", AVP_TGPP_POC_USER_ROLE, VENDOR_TGPP, type_class=PocUserRole),
@@ -3365,7 +3210,7 @@ class PocInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MbmsInformation:
     """A data container that represents the "MBMS-Information" (880) grouped AVP.
 
@@ -3387,8 +3232,7 @@ class MbmsInformation:
     mbms_data_transfer_start: int = None
     mbms_data_transfer_stop: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("tmgi", AVP_TGPP_TMGI, VENDOR_TGPP),
         AvpGenDef("mbms_service_type", AVP_TGPP_MBMS_SERVICE_TYPE, VENDOR_TGPP),
         AvpGenDef("mbms_user_service_type", AVP_TGPP_MBMS_USER_SERVICE_TYPE, VENDOR_TGPP),
@@ -3407,7 +3251,7 @@ class MbmsInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class M2mInformation:
     """A data container that represents the "M2M-Information" (1011) grouped AVP.
 
@@ -3439,8 +3283,7 @@ class M2mInformation:
     node_id: str = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("application_entity_id", AVP_ONEM2M_APPLICATION_ENTITY_ID, VENDOR_ONEM2M),
         AvpGenDef("external_id", AVP_ONEM2M_EXTERNAL_ID, VENDOR_ONEM2M),
         AvpGenDef("receiver", AVP_ONEM2M_RECEIVER, VENDOR_ONEM2M),
@@ -3468,7 +3311,7 @@ class M2mInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ServiceGenericInformation:
     """A data container that represents the "Service-Generic-Information" (1256) grouped AVP.
 
@@ -3479,8 +3322,7 @@ class ServiceGenericInformation:
     application_session_id: int = None
     delivery_status: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("application_server_id", AVP_TGPP_APPLICATION_SERVER_ID, VENDOR_TGPP),
         AvpGenDef("application_service_type", AVP_TGPP_APPLICATION_SERVICE_TYPE, VENDOR_TGPP),
         AvpGenDef("application_session_id", AVP_TGPP_APPLICATION_SESSION_ID, VENDOR_TGPP),
@@ -3488,7 +3330,7 @@ class ServiceGenericInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ImInformation:
     """A data container that represents the "IM-Information" (2110) grouped AVP.
 
@@ -3499,8 +3341,7 @@ class ImInformation:
     number_of_messages_successfully_sent: int = None
     number_of_messages_successfully_exploded: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("total_number_of_messages_sent", AVP_TGPP_TOTAL_NUMBER_OF_MESSAGES_SENT, VENDOR_TGPP),
         AvpGenDef("total_number_of_messages_exploded", AVP_TGPP_TOTAL_NUMBER_OF_MESSAGES_EXPLODED, VENDOR_TGPP),
         AvpGenDef("number_of_messages_successfully_sent", AVP_TGPP_NUMBER_OF_MESSAGES_SUCCESSFULLY_SENT, VENDOR_TGPP),
@@ -3508,7 +3349,7 @@ class ImInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class DcdInformation:
     """A data container that represents the "DCD-Information" (2115) grouped AVP.
 
@@ -3517,14 +3358,13 @@ class DcdInformation:
     content_id: str = None
     content_provider_id: str = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("content_id", AVP_TGPP_CONTENT_ID, VENDOR_TGPP),
         AvpGenDef("content_provider_id", AVP_TGPP_CONTENT_PROVIDER_ID, VENDOR_TGPP),
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class VcsInformation:
     """A data container that represents the "VCS-Information" (3410) grouped AVP.
 
@@ -3543,8 +3383,7 @@ class VcsInformation:
     stop_time: datetime.datetime = None
     ps_free_format_data: bytes = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("bearer_capability", AVP_TGPP_BEARER_CAPABILITY, VENDOR_TGPP),
         AvpGenDef("network_call_reference_number", AVP_TGPP_NETWORK_CALL_REFERENCE_NUMBER, VENDOR_TGPP),
         AvpGenDef("msc_address", AVP_TGPP_MSC_ADDRESS, VENDOR_TGPP),
@@ -3560,7 +3399,7 @@ class VcsInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ProseInformation:
     """A data container that represents the "ProSe-Information" (3447) grouped AVP.
 
@@ -3617,8 +3456,7 @@ class ProseInformation:
     target_ip_address: str = None
     pc5_radio_technology: int = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("supported_features", AVP_TGPP_SUPPORTED_FEATURES, VENDOR_TGPP, type_class=SupportedFeatures),
         AvpGenDef("announcing_ue_hplmn_identifier", AVP_TGPP_ANNOUNCING_UE_HPLMN_IDENTIFIER, VENDOR_TGPP),
         AvpGenDef("announcing_ue_vplmn_identifier", AVP_TGPP_ANNOUNCING_UE_VPLMN_IDENTIFIER, VENDOR_TGPP),
@@ -3672,7 +3510,7 @@ class ProseInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class CpdtInformation:
     """A data container that represents the "CPDT-Information" (3927) grouped AVP.
 
@@ -3684,8 +3522,7 @@ class CpdtInformation:
     sgw_change: int = None
     nidd_submission: NiddSubmission = None
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("external_identifier", AVP_TGPP_EXTERNAL_IDENTIFIER, VENDOR_TGPP),
         AvpGenDef("scef_id", AVP_TGPP_SCEF_ID, VENDOR_TGPP),
         AvpGenDef("serving_node_identity", AVP_TGPP_SERVING_NODE_IDENTITY, VENDOR_TGPP),
@@ -3694,7 +3531,7 @@ class CpdtInformation:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ServiceInformation:
     """A data container that represents the "Service-Information" (873) grouped AVP.
 
@@ -3719,8 +3556,7 @@ class ServiceInformation:
     cpdt_information: CpdtInformation = None
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
-    # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("subscription_id", AVP_SUBSCRIPTION_ID, type_class=SubscriptionId),
         AvpGenDef("aoc_information", AVP_TGPP_AOC_INFORMATION, VENDOR_TGPP, type_class=AocInformation),
         AvpGenDef("ps_information", AVP_TGPP_PS_INFORMATION, VENDOR_TGPP, type_class=PsInformation),
@@ -3740,32 +3576,30 @@ class ServiceInformation:
         AvpGenDef("cpdt_information", AVP_TGPP_CPDT_INFORMATION, VENDOR_TGPP, type_class=CpdtInformation),
     )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class AllocationRetentionPriority:
     """A data container that represents the "Allocation-Retention-Priority" (1034) grouped AVP."""
     priority_level: int = None
     pre_emption_vulnerability: int = None
     pre_emption_capability: int = None
 
-    # # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("priority_level", AVP_TGPP_PRIORITY_LEVEL, VENDOR_TGPP),
         AvpGenDef("pre_emption_vulnerability", AVP_TGPP_PRE_EMPTION_VULNERABILITY, VENDOR_TGPP),
         AvpGenDef("pre_emption_capability", AVP_TGPP_PRE_EMPTION_CAPABILITY, VENDOR_TGPP),
     )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class DefaultEpsBearerQos:
     """A data container that represents the "Default-EPS-Bearer-QoS" (1435) grouped AVP."""
     qos_class_identifier: str = None
     allocation_retention_priority: AllocationRetentionPriority = AllocationRetentionPriority
 
-    # # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("qos_class_identifier", AVP_TGPP_QOS_CLASS_IDENTIFIER, VENDOR_TGPP),
         AvpGenDef("allocation_retention_priority", AVP_TGPP_ALLOCATION_RETENTION_PRIORITY, VENDOR_TGPP,type_class=AllocationRetentionPriority),
     )
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MediaSubComponent:
     """A data container that represents the "Media-Sub-Component" (1436) grouped AVP."""
     flow_description: list[str] = dataclasses.field(default_factory=list)
@@ -3773,8 +3607,7 @@ class MediaSubComponent:
     flow_number: int = None
     flow_status: int = None
 
-    # # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("flow_description", AVP_TGPP_FLOW_DESCRIPTION, VENDOR_TGPP),
         AvpGenDef("flow_usage", AVP_TGPP_FLOW_USAGE, VENDOR_TGPP),
         AvpGenDef("flow_number", AVP_TGPP_FLOW_NUMBER, VENDOR_TGPP),
@@ -3782,7 +3615,7 @@ class MediaSubComponent:
 
     )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class MediaComponentDescription:
     """A data container that represents the "Media-Component-Description" (1435) grouped AVP."""
     media_component_number: int = None
@@ -3793,8 +3626,7 @@ class MediaComponentDescription:
     max_requested_bandwidth_dl: int = None
     media_type: int = None
 
-    # # noinspection PyDataclass
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("media_component_number", AVP_TGPP_MEDIA_COMPONENT_NUMBER, VENDOR_TGPP),
         AvpGenDef("media_sub_component", AVP_TGPP_MEDIA_SUB_COMPONENT, VENDOR_TGPP, type_class=MediaSubComponent),
         # Need AF-Application-Identifier, Max-Requested-Bandwith-UL and DL
@@ -3804,24 +3636,24 @@ class MediaComponentDescription:
         AvpGenDef("media_type", AVP_TGPP_MEDIA_TYPE, VENDOR_TGPP),
     )
     
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ChargingRuleInstall:
     """A data container that represents the "Charging-Rule-Install" (1001) grouped AVP."""
     charging_rule_base_name: list[Avp] = dataclasses.field(default_factory=list)
     charging_rule_name: list[Avp] = dataclasses.field(default_factory=list)
 
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("charging_rule_base_name", AVP_TGPP_CHARGING_RULE_BASE_NAME, VENDOR_TGPP),
         AvpGenDef("charging_rule_name", AVP_TGPP_CHARGING_RULE_NAME, VENDOR_TGPP),
     )
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, weakref_slot=True)
 class ChargingRuleRemove:
     """A data container that represents the "Charging-Rule-Remove" (1002) grouped AVP."""
     charging_rule_base_name: list[Avp] = dataclasses.field(default_factory=list)
     charging_rule_name: list[Avp] = dataclasses.field(default_factory=list)
 
-    avp_def: dataclasses.InitVar[AvpGenType] = (
+    avp_def: ClassVar[AvpGenType] = (
         AvpGenDef("charging_rule_base_name", AVP_TGPP_CHARGING_RULE_BASE_NAME, VENDOR_TGPP),
         AvpGenDef("charging_rule_name", AVP_TGPP_CHARGING_RULE_NAME, VENDOR_TGPP),
     )
@@ -7,10 +7,12 @@ from __future__ import annotations
 import logging
 
 from ..avp import Avp, AvpDecodeError
-from ..avp.generator import AvpGenDef, AvpGenerator
+from ..avp.generator import AvpGenerator, avp_def_index
 
 logger = logging.getLogger("diameter.message.avp")
 
+_UNRESOLVED = object()
+
 
 def assign_attr_from_defs(obj: AvpGenerator, avp_list: list[Avp]):
     """Go through a tree of AVP attribute definitions and populate attributes.
@@ -22,28 +24,26 @@ def assign_attr_from_defs(obj: AvpGenerator, avp_list: list[Avp]):
     The purpose of this is to convert a "dumb" AVP list tree in a `Message`
     instance into easily accessible attributes.
     """
-    needed: dict[str, AvpGenDef] = {
-        f"{a.avp_code}-{a.vendor_id}": a for a in obj.avp_def}
+    needed = avp_def_index(obj).by_code
+    # resolved on the first AVP that has no definition, most lists have none
+    additional_avps = _UNRESOLVED
 
     for avp in avp_list:
-        avp_key = f"{avp.code}-{avp.vendor_id}"
+        gen_def = needed.get((avp.code, avp.vendor_id))
 
-        if avp_key in needed:
-            attr_name = needed[avp_key].attr_name
-            has_attr = hasattr(obj, attr_name)
-            current_value = None
-            if has_attr:
-                current_value = getattr(obj, attr_name)
+        if gen_def is not None:
+            attr_name = gen_def.attr_name
+            current_value = getattr(obj, attr_name, None)
 
-            if needed[avp_key].type_class is not None:
-                attr_value = needed[avp_key].type_class()
+            if gen_def.type_class is not None:
+                attr_value = gen_def.type_class()
                 assign_attr_from_defs(attr_value, avp.value)
-                if has_attr and isinstance(current_value, list):
+                if isinstance(current_value, list):
                     current_value.append(attr_value)
                 else:
                     setattr(obj, attr_name, attr_value)
 
-            elif has_attr and isinstance(current_value, list):
+            elif isinstance(current_value, list):
                 avp_value = None
                 try:
                     avp_value = avp.value
@@ -58,8 +58,20 @@ def assign_attr_from_defs(obj: AvpGenerator, avp_list: list[Avp]):
                     logger.warning(str(e))
                 setattr(obj, attr_name, avp_value)
 
-        elif hasattr(obj, "additional_avps"):
-            getattr(obj, "additional_avps").append(avp)
+        else:
+            if additional_avps is _UNRESOLVED:
+                additional_avps = _additional_avps(obj)
+            if additional_avps is not None:
+                additional_avps.append(avp)
+
 
-        elif hasattr(obj, "_additional_avps"):
-            getattr(obj, "_additional_avps").append(avp)
+def _additional_avps(obj: AvpGenerator) -> list[Avp] | None:
+    """Retrieve the list that holds AVPs not covered by the AVP definitions.
+
+    Grouped AVP classes hold them in `additional_avps`, messages in
+    `_additional_avps`.
+    """
+    additional_avps = getattr(obj, "additional_avps", None)
+    if additional_avps is None:
+        additional_avps = getattr(obj, "_additional_avps", None)
+    return additional_avps
@@ -23,6 +23,13 @@ class ConversionError(Error):
 
 _CT = TypeVar("_CT")
 
+# precompiled formats, saves a format cache lookup on every call
+_uchar = struct.Struct(">B")
+_uint = struct.Struct(">L")
+_int = struct.Struct(">l")
+_float = struct.Struct(">f")
+_double = struct.Struct(">d")
+
 
 def raise_conversion_error(function: Callable[..., _CT]) -> Callable[..., _CT]:
     """Wrap any raised `struct.errors` in a ConversionError."""
@@ -48,11 +55,11 @@ class Packer:
 
     @raise_conversion_error
     def pack_uint(self, x: int):
-        self.__buf.write(struct.pack('>L', x))
+        self.__buf.write(_uint.pack(x))
 
     @raise_conversion_error
     def pack_int(self, x: int):
-        self.__buf.write(struct.pack('>l', x))
+        self.__buf.write(_int.pack(x))
 
     pack_enum = pack_int
 
@@ -76,11 +83,11 @@ class Packer:
 
     @raise_conversion_error
     def pack_float(self, x: float):
-        self.__buf.write(struct.pack('>f', x))
+        self.__buf.write(_float.pack(x))
 
     @raise_conversion_error
     def pack_double(self, x: float):
-        self.__buf.write(struct.pack('>d', x))
+        self.__buf.write(_double.pack(x))
 
     @raise_conversion_error
     def pack_fstring(self, n: int, s: bytes):
@@ -149,28 +156,25 @@ class Unpacker:
     def unpack_char(self) -> int:
         i = self.__pos
         self.__pos = j = i+1
-        data = self.__buf[i:j]
-        if len(data) < 1:
+        if j > len(self.__buf):
             raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack(">B", data)[0]
+        return _uchar.unpack_from(self.__buf, i)[0]
 
     @raise_conversion_error
     def unpack_uint(self) -> int:
         i = self.__pos
         self.__pos = j = i+4
-        data = self.__buf[i:j]
-        if len(data) < 4:
+        if j > len(self.__buf):
             raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack(">L", data)[0]
+        return _uint.unpack_from(self.__buf, i)[0]
 
     @raise_conversion_error
     def unpack_int(self) -> int:
         i = self.__pos
         self.__pos = j = i+4
-        data = self.__buf[i:j]
-        if len(data) < 4:
+        if j > len(self.__buf):
             raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack('>l', data)[0]
+        return _int.unpack_from(self.__buf, i)[0]
 
     unpack_enum = unpack_int
 
@@ -192,19 +196,17 @@ class Unpacker:
     def unpack_float(self) -> float:
         i = self.__pos
         self.__pos = j = i+4
-        data = self.__buf[i:j]
-        if len(data) < 4:
+        if j > len(self.__buf):
             raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack(">f", data)[0]
+        return _float.unpack_from(self.__buf, i)[0]
 
     @raise_conversion_error
     def unpack_double(self) -> float:
         i = self.__pos
         self.__pos = j = i+8
-        data = self.__buf[i:j]
-        if len(data) < 8:
+        if j > len(self.__buf):
             raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack(">d", data)[0]
+        return _double.unpack_from(self.__buf, i)[0]
 
     @raise_conversion_error
     def unpack_fstring(self, n: int) -> bytes:
@@ -2,12 +2,15 @@
 Run from package root:
 ~# python3 -m pytest -vv
 """
+import dataclasses
 import datetime
+import weakref
 import pytest
 from pytest import approx
 
 from diameter.message import avp
 from diameter.message import constants
+from diameter.message.avp import grouped
 
 
 def test_create_from_new():
@@ -223,6 +226,61 @@ def test_create_grouped_type():
     assert ag.payload == at.as_bytes() + ad.as_bytes()
 
 
+def test_grouped_type_slots():
+    sid = grouped.SubscriptionId(subscription_id_data="485079164547")
+    assert not hasattr(sid, "__dict__")
+    with pytest.raises(AttributeError):
+        sid.subscription_id_value = "485079164547"
+
+    # subclasses share the parent slots and do not re-introduce a __dict__
+    assert not hasattr(grouped.FromSpec(), "__dict__")
+    assert not hasattr(grouped.TcpOption(), "__dict__")
+
+    # instances can still be weakly referenced, like plain dataclasses
+    assert weakref.ref(sid)() is sid
+    fs = grouped.FromSpec()
+    assert weakref.ref(fs)() is fs
+    di = grouped.DestinationInterface()
+    assert weakref.ref(di)() is di
+
+
+def test_grouped_type_avp_def():
+    # the AVP definitions are class-level metadata, not dataclass fields
+    field_names = [f.name for f in dataclasses.fields(grouped.SubscriptionId)]
+    assert "avp_def" not in field_names
+    assert grouped.SubscriptionId().avp_def is grouped.SubscriptionId.avp_def
+    with pytest.raises(TypeError):
+        grouped.SubscriptionId(avp_def=())
+
+    # subclasses inherit the definitions of their parent as-is
+    assert grouped.FromSpec.avp_def is grouped.FromToSpec.avp_def
+    assert grouped.ToSpec.avp_def is grouped.FromToSpec.avp_def
+    assert grouped.DestinationInterface.avp_def is grouped.Interface.avp_def
+    assert grouped.OriginatorInterface.avp_def is grouped.Interface.avp_def
+    assert grouped.OriginatorReceivedAddress.avp_def is grouped.ReceivedAddress.avp_def
+    assert grouped.RecipientReceivedAddress.avp_def is grouped.ReceivedAddress.avp_def
+
+    # extended containers reuse the definitions of the one they extend
+    assert grouped.RecipientAddress.avp_def[:3] == grouped.OriginatorAddress.avp_def
+    assert all(a is b for a, b in zip(grouped.RecipientAddress.avp_def,
+                                      grouped.OriginatorAddress.avp_def))
+    assert all(a is b for a, b in zip(grouped.MmContentType.avp_def,
+                                      grouped.AdditionalContentInformation.avp_def))
+
+
+def test_grouped_type_avp_def_attributes():
+    # every AVP definition must point to its own, existing dataclass field
+    for cls in vars(grouped).values():
+        if not isinstance(cls, type) or cls.__module__ != grouped.__name__:
+            continue
+        if "avp_def" not in dir(cls):
+            continue
+        field_names = {f.name for f in dataclasses.fields(cls)}
+        attr_names = [a.attr_name for a in cls.avp_def]
+        assert len(attr_names) == len(set(attr_names)), cls.__name__
+        assert set(attr_names) <= field_names, cls.__name__
+
+
 def test_error_avp_vendor_mismatch():
     # cannot create an AVP where the AVP code does not belong to the vendor
     with pytest.raises(ValueError):
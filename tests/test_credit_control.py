@@ -177,3 +177,33 @@ def test_ccr_3gpp_base_avps():
     msg = ccr.as_bytes()
 
     assert ccr.header.length == len(msg)
+
+
+def test_ccr_3gpp_base_avps_decode():
+    ccr = CreditControlRequest()
+    ccr.session_id = "sctp-saegwc-poz01.lte.orange.pl;221424325;287370797;65574b0c-2d02"
+    ccr.oc_supported_features = OcSupportedFeatures(
+        oc_feature_vector=1
+    )
+
+    msg = Message.from_bytes(ccr.as_bytes())
+
+    assert isinstance(msg.oc_supported_features, OcSupportedFeatures)
+    assert msg.oc_supported_features.oc_feature_vector == 1
+    assert msg.oc_supported_features.additional_avps == []
+
+
+def test_ccr_unknown_avps_decode():
+    ccr = CreditControlRequest()
+    ccr.session_id = "sctp-saegwc-poz01.lte.orange.pl;221424325;287370797;65574b0c-2d02"
+    ccr.oc_supported_features = OcSupportedFeatures(
+        oc_feature_vector=1,
+        additional_avps=[Avp(65000, payload=b"\x00\x00\x00\x01")]
+    )
+    ccr.append_avp(Avp(65001, payload=b"\x00\x00\x00\x02"))
+
+    msg = Message.from_bytes(ccr.as_bytes())
+
+    # unknown AVPs end up in the container they were found in
+    assert [a.code for a in msg.oc_supported_features.additional_avps] == [65000]
+    assert [a.code for a in msg._additional_avps] == [65001]
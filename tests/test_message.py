@@ -2,10 +2,14 @@
 Run from package root:
 ~# python3 -m pytest -vv
 """
+import gc
+import weakref
+
 import pytest
 
 from diameter.message import Message, constants
 from diameter.message.avp import Avp
+from diameter.message.avp.generator import AvpGenDef, avp_def_index
 from diameter.message.commands import CapabilitiesExchangeRequest, CapabilitiesExchangeAnswer
 
 cer = ("010000b48000010100000000b237ee976801428f00000108400000216472612e73776c"
@@ -189,6 +193,40 @@ def test_error_command_unset_avp():
     assert msg.failed_avp is None
 
 
+def test_command_unset_avp_custom_def():
+    class CustomRequest(CapabilitiesExchangeRequest):
+        avp_def = CapabilitiesExchangeRequest.avp_def + (
+            AvpGenDef("custom_value", 65000),
+        )
+
+    msg = CustomRequest()
+    assert msg.custom_value is None
+    assert (65000, 0) in avp_def_index(msg).by_code
+    assert msg.origin_host is None
+    with pytest.raises(AttributeError):
+        _ = CapabilitiesExchangeRequest().custom_value
+
+    # definitions replaced at runtime are picked up as well
+    CustomRequest.avp_def = CapabilitiesExchangeRequest.avp_def
+    with pytest.raises(AttributeError):
+        _ = msg.custom_value
+    assert (65000, 0) not in avp_def_index(msg).by_code
+
+
+def test_command_custom_def_class_collected():
+    class CustomRequest(CapabilitiesExchangeRequest):
+        avp_def = CapabilitiesExchangeRequest.avp_def + (
+            AvpGenDef("custom_value", 65000),
+        )
+
+    assert CustomRequest().custom_value is None
+    ref = weakref.ref(CustomRequest)
+    del CustomRequest
+    gc.collect()
+    # the per-class AVP definition cache must not keep the class alive
+    assert ref() is None
+
+
 def test_answer_from_request():
     req = Message.from_bytes(bytes.fromhex(cer))
     ans = req.to_answer()